@@ -0,0 +1,80 @@
+import os
+import sys
+import tempfile
+import tracemalloc
+
+import columns
+import mapped
+import tasks
+
+
+def memory(backend, path: str) -> int:
+    '''Измерение памяти, занимаемой прочитанной базой данных.
+
+    > backend - класс списка задач (tasks.Tasks, columns.ColumnTasks
+    или mapped.MappedTasks)
+    > path - путь к файлу с базой данных
+
+    Возвращает количество байт, выделенных во время чтения файла
+    и оставшихся занятыми объектом после чтения (страницы файла,
+    отображенного в память, не учитываются).
+    '''
+    tracemalloc.start()
+    obj = backend.read(path)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    if isinstance(obj, mapped.MappedTasks):
+        obj.close()
+    del obj
+
+    return size
+
+
+def replicate(path: str, count: int) -> str:
+    '''Формирование большого файла повторением строк исходного файла.
+
+    > path - путь к исходному файлу с базой данных
+    > count - количество повторений
+
+    Возвращает путь к временному файлу (удаляется вызывающей стороной).
+    '''
+    file = open(path, "r", encoding="utf-8")
+    strings = [string.rstrip("\n") + "\n" for string in file]
+    file.close()
+
+    descriptor, temp_path = tempfile.mkstemp(suffix=".txt")
+    with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+        for _ in range(count):
+            file.writelines(strings)
+
+    return temp_path
+
+
+def main(path: str = "db.txt", count: int = 1000) -> None:
+    '''Сравнение памяти, занимаемой базой данных в разных классах.
+
+    > path - путь к исходному файлу с базой данных ("db.txt" - по умолчанию)
+    > count - количество повторений строк исходного файла (1000)
+
+    Ничего не возвращает.
+    '''
+    temp_path = replicate(path, count)
+
+    try:
+        results = [(backend.__name__, memory(backend, temp_path))
+                   for backend in (tasks.Tasks, columns.ColumnTasks,
+                                   mapped.MappedTasks)]
+        rows = len(columns.ColumnTasks.read(temp_path))
+    finally:
+        os.remove(temp_path)
+
+    print(f"Задач: {rows}")
+    for name, size in results:
+        print(f"{name}: {size / 2 ** 20:.2f} МиБ, "
+              f"{size / max(rows, 1):.0f} байт на задачу")
+
+
+if __name__ == "__main__":
+    # python benchmark.py [файл] [количество повторений]
+    main(*sys.argv[1:2], *map(int, sys.argv[2:3]))
@@ -0,0 +1,104 @@
+import itertools
+import random
+import sys
+
+import logic as log
+import shell
+import tasks
+
+
+# Пары ключей сортировки, используемые в отчетах (см. logic.function_1(),
+# logic.function_2(), logic.function_3()), и несколько других, в том
+# числе по строковым атрибутам в обоих направлениях.
+KEYS = [(1, 7), (3, 6), (5, 3), (7, 0), (6, 5), (2, 4)]
+
+
+def generate(count: int, seed: int = 0) -> tasks.Tasks:
+    '''Формирование случайного списка задач.
+
+    > count - количество задач
+    > seed - начальное значение генератора случайных чисел (0)
+
+    Значения выбираются из небольших множеств, чтобы было много задач
+    с равными ключами, в том числе строк, одна из которых является
+    началом другой.
+
+    Возвращает новый объект класса Tasks.
+    '''
+    generator = random.Random(seed)
+    executors = ["Мама", "Папа", "Дмитрий", "Андрей", "Ан"]
+    texts = ["Вынести мусор", "Вынести", "Помыть полы", "Погулять"]
+    first = log.date_format("01.01.2026", user_input=True)
+    tasklist = tasks.Tasks()
+
+    for index in range(1, count + 1):
+        recv_date = first + generator.randrange(60)
+        tasklist.insert([index, recv_date, generator.randrange(1440),
+                         recv_date + generator.randrange(30),
+                         generator.randrange(1440),
+                         generator.choice(executors),
+                         generator.choice(texts),
+                         generator.choice("abcd")])
+
+    return tasklist
+
+
+def check(tasklist: tasks.Tasks) -> list:
+    '''Сравнение сортировки Шелла с сортировкой по составному ключу.
+
+    > tasklist - объект класса Tasks (не изменяется)
+
+    Для каждой пары ключей из KEYS, каждого сочетания направлений
+    и каждой последовательности шагов (см. shell.sequences) копия
+    списка сортируется shell.sort() и shell.key_sort(). Сортировка
+    Шелла неустойчива, поэтому задачи с равными ключами могут идти
+    в разном порядке: сравниваются последовательности пар значений
+    ключей и множества задач.
+
+    Возвращает список расхождений в виде кортежей (ключи, reverse1,
+    reverse2, последовательность), пустой, если расхождений нет.
+    '''
+    failures = []
+
+    for keys, (reverse1, reverse2), sequence in itertools.product(
+            KEYS, itertools.product((False, True), repeat=2),
+            list(shell.sequences) + ["key"]):
+        by_gaps = tasklist.copy()
+        shell.sort(by_gaps, keys, reverse1, reverse2, sequence=sequence)
+        by_key = tasklist.copy()
+        shell.key_sort(by_key, keys, reverse1, reverse2)
+
+        k1, k2 = keys
+        if ([(task[k1], task[k2]) for task in by_gaps.list]
+                != [(task[k1], task[k2]) for task in by_key.list]
+                or sorted(by_gaps.list) != sorted(by_key.list)):
+            failures.append((keys, reverse1, reverse2, sequence))
+
+    return failures
+
+
+def main(count: int = 3000) -> None:
+    '''Проверка совпадения результатов сортировок.
+
+    > count - количество задач в случайном списке (3000)
+
+    Проверяются случайный список задач и база данных из db.txt.
+    При расхождении программа завершается с кодом 1.
+
+    Ничего не возвращает.
+    '''
+    failures = check(generate(count)) + check(tasks.Tasks.read("db.txt"))
+
+    for keys, reverse1, reverse2, sequence in failures:
+        print(f"Расхождение: ключи {keys}, reverse1={reverse1}, "
+              f"reverse2={reverse2}, последовательность {sequence}")
+
+    if failures:
+        sys.exit(1)
+
+    print("Сортировка Шелла и сортировка по составному ключу совпадают.")
+
+
+if __name__ == "__main__":
+    # python check_sort.py [количество задач]
+    main(*map(int, sys.argv[1:2]))
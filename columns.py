@@ -0,0 +1,452 @@
+import array
+import sys
+
+import journal
+import logic as log
+import tasks
+
+
+def encode(item: int, value: str | int) -> int:
+    '''Кодирование значения атрибута задачи для хранения в столбце.
+
+    > item - индекс атрибута задачи (кроме исполнителя и задачи)
+    > value - отформатированное значение атрибута
+
+    'ID', даты (номера дней) и время (номера минут) уже являются числами,
+    статус кодируется кодом символа, которым он хранится в объекте.
+
+    Возвращает число, сравнение которых совпадает со сравнением значений.
+    '''
+    if item == 7:
+        return ord(value)
+
+    return value
+
+
+def decode(item: int, value: int) -> str | int:
+    '''Декодирование значения атрибута задачи, хранящегося в столбце.
+
+    > item - индекс атрибута задачи (кроме исполнителя и задачи)
+    > value - закодированное значение атрибута (см. encode())
+
+    Возвращает значение атрибута в том виде, в каком оно хранится
+    в объекте класса Tasks.
+    '''
+    if item == 7:
+        return chr(value)
+
+    return value
+
+
+class ColumnTasks:
+    '''Класс списка задач, хранящегося по столбцам.
+
+    Альтернатива классу Tasks из модуля tasks для очень больших баз данных.
+    Каждый атрибут задачи хранится в отдельном компактном массиве:
+    'ID', даты и время - массивы чисел, исполнитель и задача - номера
+    строк в общей таблице строк (каждая строка хранится один раз),
+    статус - один байт.
+    Интерфейс (add, get, get_task, remove, edit_item, edit_task, print,
+    write, read) совпадает с интерфейсом класса Tasks.
+    '''
+    # Проверка атрибутов и применение журнала изменений не зависят
+    # от способа хранения задач.
+    items_check = tasks.Tasks.items_check
+    replay = tasks.Tasks.replay
+
+    def __init__(self) -> None:
+        '''Инициализация объекта.
+
+        > self - ссылка на инициализируемый объект
+
+        Инициализирует столбцы и таблицу строк объекта.
+
+        Ничего не возвращает.
+        '''
+        # columns[item] - столбец значений атрибута с индексом item.
+        self.columns = [array.array('l'), array.array('l'),
+                        array.array('h'), array.array('l'),
+                        array.array('h'), array.array('l'),
+                        array.array('l'), bytearray()]
+        # Таблица строк: номер -> строка и строка -> номер.
+        self.strings = []
+        self.codes = {}
+
+    def intern(self, string: str) -> int:
+        '''Получение номера строки в таблице строк.
+
+        > self - ссылка на объект
+        > string - значение исполнителя или задачи
+
+        Если строки в таблице еще нет, она добавляется.
+
+        Возвращает номер строки в таблице строк.
+        '''
+        code = self.codes.get(string)
+        if code is None:
+            code = len(self.strings)
+            self.strings.append(string)
+            self.codes[string] = code
+
+        return code
+
+    def pack(self, item: int, value: str | int) -> int:
+        '''Кодирование значения атрибута для хранения в объекте.
+
+        > self - ссылка на объект
+        > item - индекс атрибута задачи
+        > value - отформатированное значение атрибута
+
+        Возвращает закодированное значение атрибута.
+        '''
+        if item == 5 or item == 6:
+            return self.intern(value)
+
+        return encode(item, value)
+
+    def unpack(self, item: int, value: int) -> str | int:
+        '''Декодирование значения атрибута, хранящегося в объекте.
+
+        > self - ссылка на объект
+        > item - индекс атрибута задачи
+        > value - закодированное значение атрибута
+
+        Возвращает отформатированное значение атрибута.
+        '''
+        if item == 5 or item == 6:
+            return self.strings[value]
+
+        return decode(item, value)
+
+    def __len__(self) -> int:
+        '''Количество задач в объекте.
+
+        > self - ссылка на объект
+
+        Возвращает число задач в объекте.
+        '''
+        return len(self.columns[0])
+
+    def row(self, position: int) -> list:
+        '''Получение атрибутов задачи по её позиции.
+
+        > self - ссылка на объект
+        > position - позиция задачи в столбцах
+
+        Возвращает список атрибутов задачи в том виде, в каком они
+        хранятся в объекте класса Tasks.
+        '''
+        return [self.unpack(item, column[position])
+                for item, column in enumerate(self.columns)]
+
+    def rows(self):
+        '''Поочередное получение атрибутов всех задач.
+
+        > self - ссылка на объект
+
+        Является генератором, возвращающим списки атрибутов задач
+        (см. row()).
+        '''
+        for position in range(len(self)):
+            yield self.row(position)
+
+    @property
+    def list(self) -> list:
+        '''Список задач в виде, совместимом с Tasks.list.
+
+        > self - ссылка на объект
+
+        Список каждый раз строится заново, поэтому для больших баз данных
+        предпочтительнее rows() и row().
+
+        Возвращает список списков атрибутов задач.
+        '''
+        return list(self.rows())
+
+    def copy(self):
+        '''Копирование объекта.
+
+        > self - ссылка на объект
+
+        Столбцы копируются целиком, таблица строк общая для копий:
+        строки в ней только добавляются и никогда не меняют номер.
+
+        Возвращает копию объекта класса ColumnTasks.
+        '''
+        copy = ColumnTasks()
+        copy.columns = [column[:] for column in self.columns]
+        copy.strings = self.strings
+        copy.codes = self.codes
+
+        return copy
+
+    def insert(self, items: list, index: int = None) -> None:
+        '''Вставка задачи без проверки атрибутов.
+
+        > self - ссылка на объект
+        > items - атрибуты задачи (уже проверенные и отформатированные)
+        > index - желательный индекс задачи (None - по умолчанию)
+
+        Ничего не возвращает.
+        '''
+        if index is None:
+            index = len(self)
+
+        for item, column in enumerate(self.columns):
+            column.insert(index, self.pack(item, items[item]))
+
+    def free_id(self) -> int:
+        '''Нахождение минимального свободного 'ID' для новой задачи.
+
+        > self - ссылка на объект
+
+        Возвращает число - значение минимального свободного 'ID'.
+        '''
+        used = set(self.columns[0])
+        min_id = 1
+
+        while min_id in used:
+            min_id += 1
+
+        return min_id
+
+    def add(self, items: list, index: int = None) -> bool:
+        '''Добавление задачи в список.
+
+        > self - ссылка на объект
+        > items - атрибуты задачи
+        > index - желательный индекс задачи (None - по умолчанию)
+
+        Возвращает булево значение (True/False), означающее добавилась ли
+        задача в список задач.
+        '''
+        good_items = self.items_check(items)
+
+        if good_items:
+            self.insert(items, index)
+
+        return good_items
+
+    def position(self, index: int) -> int:
+        '''Получение позиции задачи по значению атрибута 'ID'.
+
+        > self - ссылка на объект
+        > index - значение атрибута 'ID' задачи
+
+        Возвращает позицию задачи в столбцах, если же задача не была
+        найдена вызывает исключение TaskNotFoundError.
+        '''
+        try:
+            return self.columns[0].index(index)
+        except ValueError:
+            raise tasks.TaskNotFoundError((0, index))
+
+    def remove(self, index: int) -> bool:
+        '''Удаление задачи из списка задач.
+
+        > self - ссылка на объект
+        > index - значение атрибута 'ID' задачи
+
+        Возвращает булево значение (True/False), означающее
+        удалилась ли задача из списка задач.
+        '''
+        try:
+            position = self.position(index)
+        except tasks.TaskNotFoundError:
+            return False
+
+        for column in self.columns:
+            del column[position]
+
+        return True
+
+    def replace(self, position: int, items: list) -> None:
+        '''Замена задачи на заданной позиции без проверки атрибутов.
+
+        > self - ссылка на объект
+        > position - позиция задачи в столбцах
+        > items - новые атрибуты задачи (уже проверенные и отформатированные)
+
+        Ничего не возвращает.
+        '''
+        for item, column in enumerate(self.columns):
+            column[position] = self.pack(item, items[item])
+
+    def edit_item(self, index: int, item: int, value: str) -> bool:
+        '''Редактирование значения атрибута задачи.
+
+        > self - ссылка на объект
+        > index - значение атрибута 'ID' задачи
+        > item - индекс, по которому в задаче находится атрибут
+        > value - новое значение указанного атрибута задачи
+
+        Возвращает булево значение (True/False), означающее было ли
+        изменено значение необходимого атрибута задачи.
+        '''
+        try:
+            position = self.position(index)
+        except tasks.TaskNotFoundError:
+            return False
+
+        items = log.items_format(self.row(position))
+        items[item] = value
+
+        edited = self.items_check(items)
+        if edited:
+            self.replace(position, items)
+
+        return edited
+
+    def edit_task(self, index: int, items: list) -> bool:
+        '''Редактирование задачи целиком.
+
+        > self - ссылка на объект
+        > index - значение атрибута 'ID' задачи
+        > items - список измененных значений атрибутов задачи
+
+        Возвращается булево значение (True/False), означающее
+        была ли изменена задача.
+        '''
+        try:
+            position = self.position(index)
+        except tasks.TaskNotFoundError:
+            return False
+
+        edited = self.items_check(items)
+        if edited:
+            self.replace(position, items)
+
+        return edited
+
+    def positions(self, item: int, value: str | int) -> list:
+        '''Поиск позиций задач, подходящих по условию.
+
+        > self - ссылка на объект
+        > item - индекс атрибута задачи
+        > value - значение атрибута, по которому задается условие
+
+        Значение кодируется один раз, после чего сравниваются только
+        числа в столбце (см. logic.condition()).
+
+        Возвращает список позиций подходящих задач.
+        '''
+        column = self.columns[item]
+
+        if item == 7:
+            codes = {ord(status) for status in log.status_names
+                     if log.condition(item, status, value)}
+            return [position for position, code in enumerate(column)
+                    if code in codes]
+
+        if item == 5 or item == 6:
+            if value not in self.codes:
+                return []
+            code = self.codes[value]
+        else:
+            code = encode(item, value)
+
+        return [position for position, stored in enumerate(column)
+                if stored == code]
+
+    def get(self, item: int, value: str | int):
+        '''Получение копии объекта с задачами, подходящими по условию.
+
+        > self - ссылка на объект
+        > item - индекс атрибута в задаче, по которому задается условие
+        > value - значение атрибута, по которому задается условие
+
+        Значения подходящих задач копируются в новый объект без
+        декодирования, таблица строк у объектов общая.
+
+        Возвращает копию объекта класса ColumnTasks с задачами,
+        подходящими по условию.
+        '''
+        tasklist = ColumnTasks()
+        tasklist.strings = self.strings
+        tasklist.codes = self.codes
+
+        for position in self.positions(item, value):
+            for column, source in zip(tasklist.columns, self.columns):
+                column.append(source[position])
+
+        return tasklist
+
+    def get_task(self, item: int, value: str | int) -> list:
+        '''Поиск первой подходящей по значению задачи.
+
+        > self - ссылка на объект
+        > item - индекс атрибута задачи
+        > value - значение атрибута задачи, по которому происходит поиск
+
+        Возвращает список значений атрибутов найденной задачи, если
+        же задача не была найдена вызывает исключение TaskNotFoundError.
+        '''
+        if item == 0:
+            return self.row(self.position(value))
+
+        found = [position for position in self.positions(item, value)
+                 if self.unpack(item, self.columns[item][position]) == value]
+        if not found:
+            raise tasks.TaskNotFoundError((item, value))
+
+        return self.row(found[0])
+
+    def print(self) -> None:
+        '''Вывод содержимого списка задач на экран.
+
+        > self - ссылка на объект
+
+        Максимальные длины значений вычисляются по столбцам: для
+        исполнителя и задачи - только по различным строкам. Таблица
+        формируется целиком (см. tasks.render()) и выводится одной записью.
+
+        Ничего не возвращает.
+        '''
+        if len(self) != 0:
+            max_space = [2, 16, 16, 11, 6, 10]
+            max_space[0] = max(max_space[0], len(str(max(self.columns[0]))))
+            for item in (5, 6):
+                for code in set(self.columns[item]):
+                    max_space[item - 2] = max(max_space[item - 2],
+                                              len(self.strings[code]))
+
+            sys.stdout.write(tasks.render(max_space, self.rows()))
+        else:
+            print("Список задач пуст!")
+
+    def write(self, path: str) -> None:
+        '''Запись данных из объекта в файл (см. tasks.dump()).
+
+        > self - ссылка на объект
+        > path - путь, по которому необходимо записать файл
+
+        Задачи декодируются по одной в процессе записи.
+
+        Ничего не возвращает.
+        '''
+        tasks.dump(path, self.rows())
+
+    def read(path: str):
+        '''Чтение из файла в объект класса ColumnTasks.
+
+        > path - путь, по которому находится файл
+
+        Файл читается блоками по tasks.READ_CHUNK строк (см.
+        tasks.stream()), так что в памяти одновременно находится не больше
+        одного блока задач в виде списков, а не весь файл. Затем,
+        как и в tasks.Tasks.read(), применяются изменения из журнала
+        файла (см. tasks.Tasks.replay()).
+
+        Возвращает новый объект класса ColumnTasks с данными из
+        прочитанного файла.
+        '''
+        obj = ColumnTasks()
+
+        for items in tasks.stream(path):
+            obj.insert(items)
+
+        records = journal.load(path)
+        if records:
+            obj.replay(records)
+
+        return obj
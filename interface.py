@@ -13,7 +13,7 @@ text = {"confirmation":
         "task_request":
         "Введите текст задачи: ",
         "function_request":
-        "Введите номер отчёта (1 / 2 / 3): ",
+        "Введите номер отчёта (1 / 2 / 3 / 4): ",
         "day_request":
         "Введите целое неотрицательное N: ",
         "function_1":
@@ -38,6 +38,11 @@ text = {"confirmation":
             1 - Исполнитель (по возрастанию)
             2 - Дата выполнения (по возрастанию)
                                                                     """,
+        "function_4":
+        """
+        4. Формирует список всех задач, отсортированный по ключам,
+        которые вы зададите сами (в порядке их важности)
+                                                                    """,
         "items_example":
         """
         Введите задачу в формате:
@@ -49,6 +54,10 @@ text = {"confirmation":
         "> ",
         "path_request":
         "Введите имя файла в формате file.txt: ",
+        "paths_request":
+        "Введите имена файлов через запятую (file1.txt, file2.txt): ",
+        "merge_advice":
+        "Объединенную базу данных можно сохранить командой save в новый файл.",
         "path_confirmation":
         "Использовать этот файл? (y/n): ",
         "path_advice":
@@ -59,12 +68,24 @@ text = {"confirmation":
         "Чтобы изменить этот файл, воспользуйтесь командой file",
         "id_request":
         "Введите ID строки: ",
+        "page_request":
+        "Введите номер страницы: ",
+        "pager_on":
+        "Таблица выводится по страницам (next, prev, page).",
+        "pager_off":
+        "Таблица выводится целиком.",
+        "limit_request":
+        "Введите количество первых задач отчёта (0 - все задачи): ",
         "item_request":
         "Введите номер соответствующего варианта (1-7): ",
         "key_1_request":
         "Введите значение первичного ключа сортировки (0-7): ",
         "key_2_request":
         "Введите значение вторичного ключа сортировки (0-7): ",
+        "key_3_request":
+        "Введите значение следующего ключа сортировки (0-7): ",
+        "key_confirmation":
+        "Добавить еще один ключ сортировки? (y/n): ",
         "reverse_request":
         "Сортировать по ключу по возрастанию - 1, по убыванию - 2: ",
         "item_list":
@@ -110,6 +131,10 @@ text = {"confirmation":
             > status - Найти строки по значению 'Статус'
             > sort - Сформировать отчет на основе исходной базы данных
             > show - Отобразить исходную базу данных из файла
+            > pager - Включить/выключить вывод таблицы по страницам
+            > next - Следующая страница таблицы
+            > prev - Предыдущая страница таблицы
+            > page - Перейти к странице таблицы по номеру
             > edit - Редактировать значение ячейки промежуточной базы данных
             > remove - Удалить строку в промежуточной базе данных
             > save - Сохранить изменения
@@ -123,6 +148,10 @@ text = {"confirmation":
             > add - Добавить строку
             > edit - Редактировать строку
             > remove - Удалить строку
+            > pager - Включить/выключить вывод таблицы по страницам
+            > next - Следующая страница таблицы
+            > prev - Предыдущая страница таблицы
+            > page - Перейти к странице таблицы по номеру
             > save - Сохранить изменения
             > quit - Выйти
         """}
@@ -134,6 +163,7 @@ sprite = """
          ~                                                                  ~
          ~  > help - для просмотра доступных команд                         ~
          ~  > path - для продолжения работы                                 ~
+         ~  > merge - для объединения нескольких файлов                     ~
          ~  > quit - для выхода                                             ~
          ~                                                                  s
          =====================||><><><><><><><><><>||========================
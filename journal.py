@@ -0,0 +1,125 @@
+import os
+
+import snapshot
+
+
+# Сигнатура в заголовке журнала. Кроме неё в заголовке записывается
+# отметка файла базы данных (см. snapshot.stamp()), к которому относится
+# журнал: если файл изменился, журнал считается устаревшим.
+MAGIC = "FMJ"
+
+
+def journal_path(path: str) -> str:
+    '''Получение пути к журналу изменений базы данных.
+
+    > path - путь к текстовому файлу с базой данных
+
+    Возвращает путь к журналу, лежащему рядом с текстовым файлом.
+    '''
+    return path + ".journal"
+
+
+def stamp(path: str) -> tuple | None:
+    '''Получение отметки о состоянии журнала.
+
+    > path - путь к текстовому файлу с базой данных
+
+    Возвращает кортеж (размер журнала, время изменения в наносекундах),
+    или None, если журнала нет.
+    '''
+    try:
+        return snapshot.stamp(journal_path(path))
+    except FileNotFoundError:
+        return None
+
+
+def header(path: str) -> str:
+    '''Формирование заголовка журнала.
+
+    > path - путь к текстовому файлу с базой данных
+
+    Возвращает строку заголовка (с переводом строки).
+    '''
+    size, mtime = snapshot.stamp(path)
+
+    return f"{MAGIC}|{size}|{mtime}\n"
+
+
+def append(path: str, records: list) -> int:
+    '''Добавление записей в журнал.
+
+    > path - путь к текстовому файлу с базой данных
+    > records - строки записей (без перевода строки)
+
+    Если журнала нет или его заголовок не соответствует текущему
+    состоянию файла базы данных (журнал устарел), начинается новый
+    журнал. Иначе журнал обрезается до последнего перевода строки
+    (последняя запись, оборванная сбоем, отбрасывается так же, как при
+    чтении, см. load()), и записи дописываются в его конец одной записью
+    в файл. В обоих случаях данные сбрасываются на диск, так что
+    сохраненные изменения переживают сбой программы.
+
+    Возвращает количество записей в журнале после добавления.
+    '''
+    first = header(path)
+    previous = load(path)
+
+    if previous is None:
+        mode, strings, count = "wb", [first], 0
+    else:
+        mode, strings, count = "r+b", [], len(previous)
+
+    with open(journal_path(path), mode) as file:
+        if previous is not None:
+            file.truncate(file.read().rfind(b"\n") + 1)
+            file.seek(0, os.SEEK_END)
+
+        strings.extend(record + "\n" for record in records)
+        file.write("".join(strings).encode("utf-8"))
+        file.flush()
+        os.fsync(file.fileno())
+
+    return count + len(records)
+
+
+def load(path: str) -> list | None:
+    '''Чтение записей журнала.
+
+    > path - путь к текстовому файлу с базой данных
+
+    Журнал используется, только если его заголовок соответствует
+    текущему состоянию файла базы данных. Последняя запись без перевода
+    строки (оборванная сбоем во время записи) отбрасывается.
+
+    Возвращает список строк записей, или None, если журнала нет
+    или он устарел.
+    '''
+    try:
+        file = open(journal_path(path), "r", encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
+    with file:
+        if file.readline() != header(path):
+            return None
+
+        records = []
+        for string in file:
+            if not string.endswith("\n"):
+                break
+            records.append(string[:-1])
+
+    return records
+
+
+def remove(path: str) -> None:
+    '''Удаление журнала (после записи файла базы данных целиком).
+
+    > path - путь к текстовому файлу с базой данных
+
+    Ничего не возвращает.
+    '''
+    try:
+        os.remove(journal_path(path))
+    except FileNotFoundError:
+        pass
@@ -1,6 +1,9 @@
+import functools
+
 import interface
 import shell
 import tasks
+import validator
 
 
 class YearError(Exception):
@@ -61,28 +64,6 @@ class PathError(Exception):
     pass
 
 
-def max_space(obj: tasks.Tasks) -> list:
-    '''Формирование данных о максимальной длине значений всех атрибутов.
-
-    obj -> ссылка на объект
-
-    Возвращает список с числовыми значениями максимальных длин.
-    '''
-    # Такие значения соответствуют либо длине заголовков,
-    # либо максимальной длине допустимых значений, они являются минимальными.
-    max_space = [2, 16, 16, 11, 6, 10]
-
-    for task in obj.list:
-        # При выводе задач дата и время (получения/выполнения) объединяются
-        # в одной ячейке, из этого исходят несоответствия индексов у max_space
-        # и task.
-        max_space[0] = max(max_space[0], len(str(task[0])))
-        max_space[3] = max(max_space[3], len(task[5]))
-        max_space[4] = max(max_space[4], len(task[6]))
-
-    return max_space
-
-
 def string(max_space: list, labels: list) -> str:
     '''Формирование строки для вывода информации о задаче.
 
@@ -91,22 +72,23 @@ def string(max_space: list, labels: list) -> str:
 
     Возвращает сформированную строку, содержащую информацию о задаче.
     '''
-    string = ''
+    cells = []
     for item in range(len(labels)):
         # Определение количества свободного места по бокам от строки
         # со значением атрибута в ячейке для его отцентровки.
         right_space = (max_space[item] - len(labels[item])) // 2
         left_space = max_space[item] - len(labels[item]) - right_space
-        if item != 5:
-            string += " " * right_space + labels[item] + " " * left_space + "|"
-        else:
-            # Отцентровка в ячейках 'Статус' происходит только для заголовка
-            if labels[item] != "Статус":
-                string += labels[item]
+        # Отцентровка в ячейках 'Статус' происходит только для заголовка,
+        # если за статусом следует столбец с файлом, ячейка дополняется.
+        if item == 5 and labels[item] != "Статус":
+            if item == len(labels) - 1:
+                cells.append(labels[item])
             else:
-                string += " " * right_space + labels[item] + " " * left_space
+                cells.append(labels[item] + " " * (right_space + left_space))
+        else:
+            cells.append(" " * right_space + labels[item] + " " * left_space)
 
-    return string
+    return "|".join(cells)
 
 
 def condition(item: int, rvalue: str | int, lvalue: str | int) -> bool:
@@ -150,9 +132,8 @@ def date_mask(date: str, user_input: bool = False) -> None:
     Ничего не возвращает, а только вызывает ошибку, если дата некорректна.
     '''
     try:
-        # Так как для эффективного сравнения дат в объектах они хранятся
-        # в формате ГГГГ.ММ.ДД, эта проверка должна учитывать и этот вариант,
-        # так как она вызывается при форматировании даты.
+        # Если дата вызвана не в последствии ввода пользователем,
+        # допускается и формат ГГГГ.ММ.ДД (см. date_format()).
         if len(date[: date.find(".")]) == 4 and not user_input:
             year = date[: date.find(".")]
             day = date[date.rfind(".") + 1:]
@@ -177,13 +158,15 @@ def date_mask(date: str, user_input: bool = False) -> None:
         else:
             raise DateError(date)
 
+        # Нулевые день и месяц недопустимы: дата хранится в объекте
+        # номером дня (см. date_number()) и должна восстанавливаться.
         if 0 <= year < 10000:
-            if 0 <= month < 13:
+            if 1 <= month < 13:
                 days_in_months = [31, 28 + leap_year(year), 31, 30,
                                   31, 30, 31, 31,
                                   30, 31, 30, 31]
 
-                if not (0 <= day <= days_in_months[month - 1]):
+                if not (1 <= day <= days_in_months[month - 1]):
                     raise DateError(date)
             else:
                 raise DateError(date)
@@ -256,7 +239,8 @@ def command_mask(command: str) -> None:
               "executor", "task", "get_date", "path",
               "get_time", "do_date", "do_time",
               "status", "sort", "show",
-              "save", "remove", "add", "edit"]
+              "save", "remove", "add", "edit",
+              "next", "prev", "page", "pager", "merge"]
 
     if command not in syntax:
         raise SyntaxError(command)
@@ -273,16 +257,17 @@ def level_mask(command: str, level: int) -> None:
     '''
     # Список доступных команд для каждого уровня:
     # level_commands[0] - для первого уровня и т.д.
-    level_commands = [["quit", "date", "path", "help"],
+    level_commands = [["quit", "date", "path", "help", "merge"],
 
                       ["quit", "file", "save", "help",
                        "id", "get_date", "get_time",
                        "do_date", "do_time", "executor",
                        "task", "status", "remove", "edit",
-                       "sort", "show"],
+                       "sort", "show", "next", "prev", "page", "pager"],
 
                       ["quit", "save", "help", "show",
-                       "edit", "add", "remove"]]
+                       "edit", "add", "remove",
+                       "next", "prev", "page", "pager"]]
 
     if command not in level_commands[level - 1]:
         raise LevelError(command)
@@ -311,25 +296,153 @@ def path_mask(path: str) -> None:
         raise PathError(path)
 
 
-def date_format(date: str, user_input: bool = False) -> str:
+def date_number(year: int, month: int, day: int) -> int:
+    '''Вычисление порядкового номера дня.
+
+    > year, month, day - год, месяц и день корректной даты
+
+    Дни отсчитываются от 01.01.0000 (номер 0). Год считается начинающимся
+    с марта, тогда високосный день оказывается последним днем года и
+    количество дней до начала месяца вычисляется одной формулой.
+
+    Возвращает число - номер дня.
+    '''
+    if month <= 2:
+        year -= 1
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * (month + (-3 if month > 2 else 9)) + 2) // 5 + day - 1
+    day_of_era = (year_of_era * 365 + year_of_era // 4 - year_of_era // 100
+                  + day_of_year)
+
+    # 60 - количество дней от 01.01.0000 до 01.03.0000.
+    return era * 146097 + day_of_era + 60
+
+
+def number_date(number: int) -> tuple:
+    '''Вычисление даты по порядковому номеру дня.
+
+    > number - номер дня (см. date_number())
+
+    Возвращает кортеж (год, месяц, день).
+    '''
+    number -= 60
+    era = number // 146097
+    day_of_era = number - era * 146097
+    year_of_era = (day_of_era - day_of_era // 1460 + day_of_era // 36524
+                   - day_of_era // 146096) // 365
+    day_of_year = day_of_era - (365 * year_of_era + year_of_era // 4
+                                - year_of_era // 100)
+    month = (5 * day_of_year + 2) // 153
+    day = day_of_year - (153 * month + 2) // 5 + 1
+    month += 3 if month < 10 else -9
+    year = year_of_era + era * 400 + (month <= 2)
+
+    return (year, month, day)
+
+
+# Максимальное количество различных дат, запоминаемых при разборе
+# и при форматировании (см. date_parse(), date_string()).
+DATE_CACHE = 4096
+
+
+@functools.lru_cache(maxsize=DATE_CACHE)
+def date_parse(date: str, user_input: bool = False) -> int:
+    '''Проверка даты и преобразование её в номер дня.
+
+    > date - дата в виде строки
+    > user_input - булево значение, необходимое для date_mask()
+
+    Результаты запоминаются для последних DATE_CACHE различных дат,
+    некорректные даты не запоминаются (вызывают исключение DateError).
+
+    Возвращает число - номер дня (см. date_number()).
+    '''
+    date_mask(date, user_input)
+
+    first = int(date[: date.find(".")])
+    second = int(date[date.find(".") + 1: date.rfind(".")])
+    third = int(date[date.rfind(".") + 1:])
+
+    # Дата в формате ГГГГ.ММ.ДД допускается date_mask() только
+    # не в последствии ввода пользователем.
+    if date.find(".") == 4 and not user_input:
+        return date_number(first, second, third)
+
+    return date_number(third, second, first)
+
+
+@functools.lru_cache(maxsize=DATE_CACHE)
+def date_string(number: int) -> str:
+    '''Преобразование номера дня в строку ДД.ММ.ГГГГ.
+
+    > number - номер дня (см. date_number())
+
+    Результаты запоминаются для последних DATE_CACHE различных дат.
+
+    Возвращает строку с датой.
+    '''
+    year, month, day = number_date(number)
+
+    return f"{day:02}.{month:02}.{year:04}"
+
+
+def date_cache_stats() -> dict:
+    '''Получение статистики использования запомненных дат.
+
+    Ничего не принимает.
+
+    Возвращает словарь: имя функции (date_parse, date_string) ->
+    кортеж (попадания, промахи, доля попаданий).
+    '''
+    stats = {}
+
+    for function in (date_parse, date_string):
+        info = function.cache_info()
+        calls = info.hits + info.misses
+        stats[function.__name__] = (info.hits, info.misses,
+                                    info.hits / calls if calls else 0.0)
+
+    return stats
+
+
+def date_format(date: str | int, user_input: bool = False) -> int | str:
     '''Форматирование даты.
 
     > date - дата, которую необходимо отформатировать
     > user_input - булево значение, необходимое для date_mask()
 
+    Для эффективного сравнения даты хранятся в объекте номерами дней
+    (см. date_number()). Строка проверяется и преобразуется в номер дня
+    (см. date_parse()), номер дня, хранящийся в объекте, - обратно
+    в строку ДД.ММ.ГГГГ без повторной проверки (см. date_string()).
+    Одинаковые даты преобразуются только один раз.
+
     Возвращает отформатированную дату.
     '''
-    date_mask(date, user_input)
+    if isinstance(date, int):
+        return date_string(date)
+
+    return date_parse(date, user_input)
 
-    first = date[: date.find(".")]
-    second = date[date.find(".") + 1: date.rfind(".")]
-    third = date[date.rfind(".") + 1:]
 
-    # По сути, меняет местами первый и последние значения даты (год и день).
-    # Это нужно для хранения более эффективных для сравнения дат в объекте.
-    date = f"{third}.{second}.{first}"
+def time_format(time: str | int) -> int | str:
+    '''Форматирование времени.
 
-    return date
+    > time - время, которое необходимо отформатировать
+
+    Время хранится в объекте номером минуты в сутках. Строка ЧЧ:ММ
+    проверяется и преобразуется в номер минуты, номер минуты - обратно
+    в строку без повторной проверки.
+
+    Возвращает отформатированное время.
+    '''
+    if isinstance(time, int):
+        return f"{time // 60:02}:{time % 60:02}"
+
+    time_mask(time)
+
+    return int(time[: time.find(":")]) * 60 + int(time[time.find(":") + 1:])
 
 
 def status_format(status: str, user_input: bool = False) -> str:
@@ -357,6 +470,11 @@ def status_format(status: str, user_input: bool = False) -> str:
     return status
 
 
+# Названия статусов по их представлению в объекте (см. status_format()).
+status_names = {'a': "Провалена", 'b': "Получена",
+                'c': "В процессе", 'd': "Выполнена"}
+
+
 def items_format(items: list) -> list:
     '''Форматирование значений всех атрибутов задачи.
 
@@ -365,7 +483,9 @@ def items_format(items: list) -> list:
     Возвращает отформатированный список значений атрибутов задачи.
     '''
     items[1] = date_format(items[1])
+    items[2] = time_format(items[2])
     items[3] = date_format(items[3])
+    items[4] = time_format(items[4])
     items[7] = status_format(items[7])
 
     return items
@@ -385,7 +505,7 @@ def function_request() -> str | None:
             break
         try:
             function = int(function)
-            if function in range(1, 4):
+            if function in range(1, 5):
                 return str(function)
             else:
                 print("Некорректный номер функции")
@@ -419,13 +539,14 @@ def day_request() -> int | None:
     return None
 
 
-def date_request() -> str | None:
+def date_request() -> int | None:
     '''Требование ввода даты.
 
     Ничего не принимает.
 
-    Возвращает строку, если пользователь ввел корректное значение, или None,
-    если пользователь предпочел выйти из цикла, с помощью "quit".
+    Возвращает номер дня (см. date_format()), если пользователь ввел
+    корректное значение, или None, если пользователь предпочел выйти
+    из цикла, с помощью "quit".
     '''
     while True:
         date = str(input(interface.text["date_request"]))
@@ -484,6 +605,30 @@ def path_request(banned_path: str = None) -> str | None:
     return None
 
 
+def paths_request() -> list | None:
+    '''Требование ввода путей к нескольким файлам.
+
+    Ничего не принимает.
+
+    Возвращает список строк, если пользователь ввел корректные значения
+    (через запятую), или None, если пользователь предпочел выйти из цикла,
+    с помощью "quit".
+    '''
+    while True:
+        paths = str(input(interface.text["paths_request"]))
+        if paths == "quit":
+            break
+        paths = [path.strip() for path in paths.split(",")]
+        try:
+            for path in paths:
+                path_mask(path)
+            return paths
+        except PathError as exception:
+            print(f"Некорректное имя файла: {exception.args[0]}")
+
+    return None
+
+
 def confirmation_request(arg: str = "") -> bool:
     '''Требование ввода подтверждения.
 
@@ -534,6 +679,56 @@ def id_request(obj: tasks.Tasks) -> int | None:
     return None
 
 
+def limit_request() -> int | None:
+    '''Требование ввода наибольшего количества задач в отчете.
+
+    Ничего не принимает.
+
+    Возвращает число (0 - без ограничения), если пользователь ввел
+    корректное значение, или None, если пользователь предпочел выйти
+    из цикла, с помощью "quit".
+    '''
+    while True:
+        limit = str(input(interface.text["limit_request"]))
+        if limit == "quit":
+            break
+        try:
+            limit = int(limit)
+            if limit >= 0:
+                return limit
+            else:
+                print("Количество задач должно быть неотрицательным!")
+        except ValueError:
+            print(f"Некорректное количество задач: {limit}")
+
+    return None
+
+
+def page_request(obj: tasks.Tasks) -> int | None:
+    '''Требование ввода номера страницы таблицы задач.
+
+    > obj - ссылка на объект, для проверки существования страницы
+
+    Возвращает число - номер страницы, начиная с нуля (пользователь вводит
+    номер, начиная с единицы), если пользователь ввел корректное значение,
+    или None, если пользователь предпочел выйти из цикла, с помощью "quit".
+    '''
+    while True:
+        page = str(input(interface.text["page_request"]))
+        if page == "quit":
+            break
+        try:
+            page = int(page)
+            if page in range(1, obj.pages() + 1):
+                return page - 1
+            else:
+                print(f"Страницы {page} не существует!")
+        except ValueError:
+            print(f"Некорректный номер страницы: {page}")
+
+    return None
+
+
 def item_request() -> int | None:
     '''Требование ввода индекса атрибута задачи.
 
@@ -649,21 +844,45 @@ def key_request(number: int) -> tuple | None:
     return (key, reverse)
 
 
-def time_request() -> str | None:
-    '''Требование ввода времени.
+def keys_request() -> list | None:
+    '''Последовательное требование ввода ключей сортировки.
 
     Ничего не принимает.
 
-    Возвращает строку, если пользователь ввел корректное значение, или None,
+    Ключи запрашиваются по одному (см. key_request()), начиная с
+    первичного, пока пользователь не откажется добавлять следующий.
+
+    Возвращает список кортежей (индекс атрибута, признак сортировки
+    по убыванию), если пользователь ввел корректные значения, или None,
     если пользователь предпочел выйти из цикла, с помощью "quit".
     '''
+    keys = []
+
+    while True:
+        key = key_request(min(len(keys) + 1, 3))
+        if key is None:
+            return None
+
+        keys.append(key)
+        if not confirmation_request("key_"):
+            return keys
+
+
+def time_request() -> int | None:
+    '''Требование ввода времени.
+
+    Ничего не принимает.
+
+    Возвращает номер минуты в сутках (см. time_format()), если пользователь
+    ввел корректное значение, или None, если пользователь предпочел выйти
+    из цикла, с помощью "quit".
+    '''
     while True:
         time = str(input(interface.text["time_request"]))
         if time == "quit":
             break
         try:
-            time_mask(time)
-            return time
+            return time_format(time)
         except TimeError:
             print("Некорректное время!")
 
@@ -747,17 +966,12 @@ def free_id(obj: tasks.Tasks) -> int:
 
     > obj - ссылка на объект
 
+    Свободные значения 'ID' отслеживаются самим объектом (см.
+    Tasks.free_id()), поэтому порядок задач в списке не меняется.
+
     Возвращает число - значение минимального свободного 'ID'.
     '''
-    # Сортировка по 'ID' задачи по возрастанию для эффективности поиска.
-    shell.sort(obj, (0, 0))
-    min_id = 1
-
-    for task in obj.list:
-        if min_id == task[0]:
-            min_id += 1
-
-    return min_id
+    return obj.free_id()
 
 
 def add_task(obj: tasks.Tasks) -> None:
@@ -765,6 +979,9 @@ def add_task(obj: tasks.Tasks) -> None:
 
     > obj - ссылка на объект
 
+    Введенная задача проверяется validator.validate(), при ошибке
+    выводится отчет и ввод повторяется.
+
     Ничего не возвращает.
     '''
     index = free_id(obj)
@@ -779,134 +996,173 @@ def add_task(obj: tasks.Tasks) -> None:
         # Ввод осуществляется без 'ID', так что он добавляется вручную.
         items.insert(0, index)
 
-        try:
-            if obj.add(items):
-                print("База данных успешно изменена.")
-                break
-        except ItemsError:
-            print("Некорректное количество данных!")
+        # Отчет об ошибках содержит не больше одной ошибки (см. validator).
+        good, report = validator.validate([items])
+        if good:
+            obj.insert(good[0])
+            print("База данных успешно изменена.")
+            break
+
+        validator.print_report(report)
 
 
-def get_last_date(days: int, curr_date: str) -> str:
+def get_last_date(days: int, curr_date: int) -> int:
     '''Нахождение даты, на определенное количество дней в прошлом.
 
     > days - количество дней
-    > curr_date - дата, от которой ведется отсчет дней
-
-    Возвращается строка - такая дата.
-    '''
-    # Текущая дата вводится в том же формате, в каком и хранится в объекте.
-    curr_day = int(curr_date[curr_date.rfind(".") + 1:])
-    curr_month = int(curr_date[curr_date.find(".") + 1: curr_date.rfind(".")])
-    curr_year = int(curr_date[: curr_date.find(".")])
-
-    days_in_months = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
-
-    curr_day -= days
-
-    while curr_day <= 0:
-        curr_month -= 1
-
-        if curr_month == 0:
-            curr_month = 12
-            curr_year -= 1
-            if curr_year < 0:
-                raise YearError()
-
-        days_in_current_month = days_in_months[curr_month - 1]
-
-        if curr_month == 2 and leap_year(curr_year):
-            days_in_current_month += 1
-
-        curr_day += days_in_current_month
-
-    # Форматирование даты так, чтобы она соответствовала виду: ГГГГ.ММ.ДД
-    if curr_year < 10:
-        last_year = f"000{curr_year}"
-    elif curr_year < 100:
-        last_year = f"00{curr_year}"
-    elif curr_year < 1000:
-        last_year = f"0{curr_year}"
-    else:
-        last_year = f"{curr_year}"
+    > curr_date - дата, от которой ведется отсчет (номер дня)
 
-    if curr_month < 10:
-        last_month = f"0{curr_month}"
-    else:
-        last_month = f"{curr_month}"
+    Так как даты хранятся номерами дней, достаточно вычитания.
 
-    if curr_day < 10:
-        last_day = f"0{curr_day}"
-    else:
-        last_day = f"{curr_day}"
+    Возвращается число - номер дня такой даты, если же она раньше
+    01.01.0000 вызывает исключение YearError.
+    '''
+    last_date = curr_date - days
 
-    last_date = last_year + "." + last_month + "." + last_day
+    if last_date < 0:
+        raise YearError()
 
     return last_date
 
 
-def function_1(obj: tasks.Tasks, days: int, curr_date: str):
+def function_1(obj: tasks.Tasks, days: int, curr_date: int,
+               sequence: str = "hibbard", limit: int = None):
     '''Первая функция, которая должна поддерживаться программой по условию.
 
     obj - ссылка на объект
     days - количество дней, чтобы найти дату на это количество дней в прошлом
     curr_date - дата, от которой ведется отсчет
+    sequence - последовательность шагов сортировки Шелла (см. shell.sort()),
+    используется, если у объекта нет индекса по дате получения
+    limit - наибольшее количество задач в отчете (None - все задачи),
+    первые задачи выбираются без сортировки всего списка (см. shell.top())
 
     Возвращает отсортированную копию объекта класса Tasks из модуля tasks.
     '''
     last_date = get_last_date(days, curr_date)
+
+    # При наличии индекса по дате получения задачи выбираются
+    # двоичным поиском сразу в нужном порядке.
+    if 1 in obj.indexes:
+        return obj.period(last_date, curr_date, limit)
+
     to_sort = tasks.Tasks()
+    to_sort.sources = obj.sources
 
     for task in obj.list:
         if last_date <= task[1] <= curr_date:
-            to_sort.list.append(task)
-    
-    shell.sort(to_sort, (1, 7), reverse1=True, reverse2=True)
+            to_sort.insert(task)
+
+    if limit is not None:
+        return shell.top(to_sort, (1, 7), limit, reverse1=True, reverse2=True)
+
+    shell.sort(to_sort, (1, 7), reverse1=True, reverse2=True,
+               sequence=sequence)
 
     return to_sort
 
 
-def function_2(obj: tasks.Tasks, executor: str):
+def function_2(obj: tasks.Tasks, executor: str, sequence: str = "hibbard",
+               limit: int = None):
     '''Вторая функция, которая должна поддерживаться программой по условию.
 
     obj - ссылка на объект
     executor - имя исполнителя
+    sequence - последовательность шагов сортировки Шелла (см. shell.sort()),
+    используется, если у объекта нет индекса по статусу
+    limit - наибольшее количество задач в отчете (None - все задачи),
+    первые задачи выбираются без сортировки всего списка (см. shell.top())
 
     Возвращает отсортированную копию объекта класса Tasks из модуля tasks.
     '''
+    # При наличии индекса по статусу задачи берутся из упорядоченного
+    # списка проваленных задач исполнителя.
+    if 7 in obj.indexes:
+        return obj.failures(executor, limit)
+
     # Получение списка проваленых задач определенного исполнителя.
-    to_sort = obj.get(5, executor).get(7, "a")
+    to_sort = obj.select([(5, executor), (7, "a")])
+
+    if limit is not None:
+        return shell.top(to_sort, (3, 6), limit, reverse1=True)
 
-    shell.sort(to_sort, (3, 6), reverse1=True)
+    shell.sort(to_sort, (3, 6), reverse1=True, sequence=sequence)
 
     return to_sort
 
 
-def function_3(obj: tasks.Tasks):
+def function_3(obj: tasks.Tasks, sequence: str = "hibbard",
+               limit: int = None):
     '''Третья функция, которая должна поддерживаться программой по условию.
 
     obj - ссылка на объект
+    sequence - последовательность шагов сортировки Шелла (см. shell.sort()),
+    используется, если у объекта нет индекса по статусу
+    limit - наибольшее количество задач в отчете (None - все задачи),
+    первые задачи выбираются без сортировки всего списка (см. shell.top())
 
     Возвращает отсортированную копию объекта класса Tasks из модуля tasks.
     '''
+    # При наличии индекса по статусу задачи берутся из упорядоченного
+    # списка задач на исполнении.
+    if 7 in obj.indexes:
+        return obj.progress(limit)
+
     # Получение списка задач, находящихся на исполнении (В процессе/Получена).
     to_sort = obj.get(7, "bc")
 
-    shell.sort(to_sort, (5, 3))
+    if limit is not None:
+        return shell.top(to_sort, (5, 3), limit)
+
+    shell.sort(to_sort, (5, 3), sequence=sequence)
+
+    return to_sort
+
+
+def function_4(obj: tasks.Tasks, keys: list, limit: int = None):
+    '''Отчет, упорядоченный по ключам, заданным пользователем.
+
+    obj - ссылка на объект
+    keys - список кортежей (индекс атрибута, признак сортировки
+    по убыванию), начиная с первичного ключа
+    limit - наибольшее количество задач в отчете (None - все задачи),
+    первые задачи выбираются без сортировки всего списка
+    (см. shell.multi_top())
+
+    Ключи один раз объединяются в составной ключ, по которому список
+    упорядочивается устойчивой сортировкой (см. shell.multi_sort()).
+
+    Возвращает отсортированную копию объекта класса Tasks из модуля tasks.
+    '''
+    if limit is not None:
+        return shell.multi_top(obj, keys, limit)
+
+    to_sort = obj.copy()
+
+    shell.multi_sort(to_sort, keys)
 
     return to_sort
 
 
 def lifecycle(level: int = 1, path: str = "db.txt",
-              obj: tasks.Tasks = None) -> None:
+              obj: tasks.Tasks = None) -> tuple | None:
     '''Жизненный цикл программы, получающий и выполняющий команды.
 
     > level - уровень программы (по умолчанию - 1)
-    > path - путь к файлу, который необходимо прочитать
+    > path - путь к файлу, который необходимо прочитать (None - для
+    объединенной базы данных, см. tasks.Tasks.merge())
     > obj - ссылка на объект (при запуске на первый уровень она не требуется)
 
-    Ничего не возвращает.
+    На третьем уровне запоминается последнее сохраненное в файл path
+    состояние объекта, чтобы второму уровню не пришлось заново читать
+    файл после возвращения с третьего уровня.
+
+    Возвращает кортеж (сохраненный объект, отметка базы данных после
+    сохранения (см. tasks.stamp())), если на третьем уровне
+    объект был сохранен в файл path, иначе - None.
     '''
+    saved = None
+
     # Спрайт приветственного меню.
     if level == 1:
         print(interface.sprite)
@@ -917,6 +1173,10 @@ def lifecycle(level: int = 1, path: str = "db.txt",
         temp_obj = obj.copy()
         temp_obj.print()
 
+    # На третьем уровне отслеживаются изменения для журнала файла.
+    if level == 3:
+        temp_obj.journal = []
+
     while True:
         command = str(input("> "))
         try:
@@ -935,12 +1195,21 @@ def lifecycle(level: int = 1, path: str = "db.txt",
 
                     # file - перемещает пользователя на 3 уровень.
                     # После того, как программа вернется на второй уровень,
-                    # снова считывает файл в исходный объект, для того, чтобы
-                    # сразу отобразить изменения, произошедшие на 3 уровне.
+                    # исходный объект заменяется сохраненным на 3 уровне,
+                    # для того, чтобы сразу отобразить изменения. Файл
+                    # читается заново, только если он изменился иначе.
                     case "file":
-                        if confirmation_request():
-                            lifecycle(3, path, obj)
-                            obj = tasks.Tasks.read(path)
+                        # Объединенная база данных не связана с одним файлом.
+                        if path is None:
+                            print(interface.text["merge_advice"])
+                        elif confirmation_request():
+                            before = tasks.stamp(path)
+                            result = lifecycle(3, path, obj)
+                            current = tasks.stamp(path)
+                            if result is not None and result[1] == current:
+                                obj = result[0]
+                            elif current != before:
+                                obj = tasks.Tasks.read(path)
                             temp_obj = obj.copy()
                             temp_obj.print()
 
@@ -966,6 +1235,19 @@ def lifecycle(level: int = 1, path: str = "db.txt",
                                 except FileNotFoundError:
                                     print("Такого файла не существует.")
 
+                    # После чтения всех файлов пользователь перемещается
+                    # во 2 уровень с объединенной базой данных.
+                    case "merge":
+                        paths = paths_request()
+                        if paths is not None:
+                            print(f"Чтение {', '.join(paths)}...")
+                            try:
+                                obj = tasks.Tasks.merge(paths)
+                                lifecycle(2, None, obj)
+                            except FileNotFoundError as exception:
+                                print("Такого файла не существует: "
+                                      f"{exception.filename}")
+
                     case "help":
                         print(interface.text["help_"+str(level)])
 
@@ -979,12 +1261,29 @@ def lifecycle(level: int = 1, path: str = "db.txt",
                         else:
                             print(f"База данных будет записана в: {path}")
                             if confirmation_request("path_"):
-                                temp_obj.write(path)
+                                new_path = path
                             else:
                                 new_path = path_request()
-                                if new_path is not None:
-                                    if confirmation_request("path_"):
-                                        temp_obj.write(new_path)
+                                if (new_path is not None
+                                        and not confirmation_request("path_")):
+                                    new_path = None
+
+                            # Открытый файл сохраняется одинаково, выбран ли
+                            # он сразу или введен повторно: в файл
+                            # дописываются только изменения (см.
+                            # tasks.Tasks.save()). Если файл записан целиком,
+                            # 'ID' задач становятся номерами строк, как при
+                            # чтении файла, а записи об изменениях больше
+                            # не нужны. Сохраненный объект становится
+                            # исходным.
+                            if new_path == path:
+                                if temp_obj.save(path):
+                                    temp_obj = temp_obj.renumbered()
+                                    temp_obj.journal = []
+                                obj = temp_obj.copy()
+                                saved = (obj, tasks.stamp(path))
+                            elif new_path is not None:
+                                temp_obj.write(new_path)
 
                     case "remove":
                         index = id_request(temp_obj)
@@ -1011,6 +1310,38 @@ def lifecycle(level: int = 1, path: str = "db.txt",
 
                     case "show":
                         temp_obj = obj.copy()
+                        if level == 3:
+                            temp_obj.journal = []
+
+                        temp_obj.print()
+
+                    # pager - включение и выключение постраничного вывода.
+                    case "pager":
+                        tasks.PAGING = not tasks.PAGING
+                        temp_obj.page = 0
+                        if tasks.PAGING:
+                            print(interface.text["pager_on"])
+                        else:
+                            print(interface.text["pager_off"])
+
+                        temp_obj.print()
+
+                    # next, prev, page - листание таблицы по страницам,
+                    # форматируются только задачи выбранной страницы.
+                    case "next":
+                        temp_obj.page += 1
+
+                        temp_obj.print()
+
+                    case "prev":
+                        temp_obj.page -= 1
+
+                        temp_obj.print()
+
+                    case "page":
+                        page = page_request(temp_obj)
+                        if page is not None:
+                            temp_obj.page = page
 
                         temp_obj.print()
 
@@ -1018,6 +1349,7 @@ def lifecycle(level: int = 1, path: str = "db.txt",
                         print(interface.text["function_1"])
                         print(interface.text["function_2"])
                         print(interface.text["function_3"])
+                        print(interface.text["function_4"])
                         function = function_request()
                         if function is not None:
                             if function == "1":
@@ -1025,13 +1357,32 @@ def lifecycle(level: int = 1, path: str = "db.txt",
                                 if date_and_day is not None:
                                     date = date_and_day[0]
                                     day = date_and_day[1]
-                                    temp_obj = function_1(obj, day, date)
+                                    limit = limit_request()
+                                    if limit is not None:
+                                        temp_obj = function_1(
+                                            obj, day, date,
+                                            limit=limit or None)
                             elif function == "2":
                                 executor = executor_request(obj)
                                 if executor is not None:
-                                    temp_obj = function_2(obj, executor)
+                                    limit = limit_request()
+                                    if limit is not None:
+                                        temp_obj = function_2(
+                                            obj, executor,
+                                            limit=limit or None)
                             elif function == "3":
-                                temp_obj = function_3(obj)
+                                limit = limit_request()
+                                if limit is not None:
+                                    temp_obj = function_3(
+                                        obj, limit=limit or None)
+                            elif function == "4":
+                                keys = keys_request()
+                                if keys is not None:
+                                    limit = limit_request()
+                                    if limit is not None:
+                                        temp_obj = function_4(
+                                            obj, keys,
+                                            limit=limit or None)
 
                         temp_obj.print()
 
@@ -1061,7 +1412,7 @@ def lifecycle(level: int = 1, path: str = "db.txt",
                     case "do_date":
                         do_date = date_request()
                         if do_date is not None:
-                            temp_obj = obj.get(3, do_date, parse=True)
+                            temp_obj = obj.get(3, do_date)
 
                         temp_obj.print()
 
@@ -1099,3 +1450,5 @@ def lifecycle(level: int = 1, path: str = "db.txt",
 
         except SyntaxError as exception:
             print(f"Неизвестная команда: {exception.args[0]}")
+
+    return saved
@@ -1,4 +1,5 @@
 import logic
 
 
-logic.lifecycle()
+if __name__ == "__main__":
+    logic.lifecycle()
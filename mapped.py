@@ -0,0 +1,415 @@
+import array
+import bisect
+import mmap
+
+import journal
+import logic as log
+import tasks
+import validator
+
+
+class MappedTasks:
+    '''Класс списка задач, читаемого из отображенного в память файла.
+
+    Режим чтения очень больших баз данных: файл отображается в память
+    (см. модуль mmap), а в объекте хранятся только смещения начала и конца
+    каждой строки и её номер (значение атрибута 'ID'). Значения атрибутов
+    декодируются из файла только при обращении к ним, поэтому поиск по
+    одному атрибуту (get(), get_task()) декодирует только его столбец,
+    а задачи целиком - только подходящие по условию.
+
+    Количество значений в строке проверяется при чтении, сами значения
+    атрибутов - при декодировании задачи целиком (см. row()), так что
+    сообщения о некорректных значениях выводятся при первом обращении
+    к задаче. Объект предназначен только для чтения: результаты поиска
+    и load() возвращают обычные объекты класса Tasks.
+
+    Изменения из журнала файла (см. модуль journal) не записываются
+    в файл, а хранятся в объекте поверх смещений строк (см. overlay()).
+    '''
+    # Проверка атрибутов не зависит от способа хранения задач.
+    items_check = tasks.Tasks.items_check
+
+    def __init__(self) -> None:
+        '''Инициализация объекта.
+
+        > self - ссылка на инициализируемый объект
+
+        Инициализирует пустое отображение и массивы смещений строк.
+
+        Ничего не возвращает.
+        '''
+        self.data = b""
+        # Для каждой строки с правильным количеством значений: смещения
+        # её начала и конца в файле и номер строки в файле ('ID').
+        self.starts = array.array('q')
+        self.ends = array.array('q')
+        self.numbers = array.array('l')
+        # Изменения из журнала: позиция строки -> атрибуты измененной
+        # задачи и атрибуты добавленных задач (их позиции следуют
+        # за позициями строк файла).
+        self.changed = {}
+        self.added = []
+
+    def __len__(self) -> int:
+        '''Количество строк с правильным количеством значений.
+
+        > self - ссылка на объект
+
+        Возвращает число строк, из которых могут быть получены задачи,
+        вместе с задачами, добавленными через журнал.
+        '''
+        return len(self.numbers) + len(self.added)
+
+    def stored(self, position: int) -> list | None:
+        '''Получение задачи, измененной или добавленной через журнал.
+
+        > self - ссылка на объект
+        > position - позиция задачи в объекте
+
+        Возвращает список атрибутов задачи, или None, если задачу
+        нужно декодировать из файла.
+        '''
+        if position >= len(self.numbers):
+            return self.added[position - len(self.numbers)]
+
+        return self.changed.get(position)
+
+    def field(self, position: int, item: int) -> str:
+        '''Получение строкового значения атрибута задачи из файла.
+
+        > self - ссылка на объект
+        > position - позиция строки в объекте
+        > item - индекс атрибута задачи (1-7)
+
+        Граница значения находится поиском разделителей '|' внутри строки.
+
+        Возвращает значение атрибута в том виде, в каком оно записано
+        в файле.
+        '''
+        start = self.starts[position]
+        end = self.ends[position]
+
+        for _ in range(item - 1):
+            start = self.data.find(b"|", start, end) + 1
+        stop = self.data.find(b"|", start, end)
+        if stop == -1:
+            stop = end
+
+        return self.data[start:stop].decode("utf-8")
+
+    def value(self, position: int, item: int) -> str | int | None:
+        '''Декодирование значения атрибута задачи.
+
+        > self - ссылка на объект
+        > position - позиция строки в объекте
+        > item - индекс атрибута задачи
+
+        Возвращает отформатированное значение атрибута (в том виде,
+        в каком оно хранится в объекте класса Tasks), или None, если
+        значение некорректно.
+        '''
+        items = self.stored(position)
+        if items is not None:
+            return items[item]
+
+        if item == 0:
+            return self.numbers[position]
+
+        value = self.field(position, item)
+
+        try:
+            match item:
+                case 1 | 3:
+                    return log.date_format(value)
+                case 2 | 4:
+                    return log.time_format(value)
+                case 7:
+                    return validator.STATUSES.get(value.strip())
+        except (log.DateError, log.TimeError):
+            return None
+
+        return value
+
+    def row(self, position: int) -> list | None:
+        '''Декодирование задачи целиком.
+
+        > self - ссылка на объект
+        > position - позиция строки в объекте
+
+        Значения атрибутов проверяются так же, как при обычном чтении
+        файла (см. tasks.stream()).
+
+        Возвращает список атрибутов задачи, или None, если значения
+        атрибутов некорректны.
+        '''
+        items = self.stored(position)
+        if items is not None:
+            return items
+
+        start = self.starts[position]
+        end = self.ends[position]
+
+        items = self.data[start:end].decode("utf-8").split("|")
+        items.insert(0, self.numbers[position])
+        items[7] = items[7].strip()
+
+        if self.items_check(items):
+            return items
+
+        return None
+
+    def rows(self):
+        '''Поочередное получение всех задач с корректными значениями.
+
+        > self - ссылка на объект
+
+        Является генератором, возвращающим списки атрибутов задач
+        (см. row()).
+        '''
+        for position in range(len(self)):
+            items = self.row(position)
+            if items is not None:
+                yield items
+
+    def positions(self, item: int, value: str | int) -> list:
+        '''Поиск позиций строк, подходящих по условию.
+
+        > self - ссылка на объект
+        > item - индекс атрибута задачи
+        > value - значение атрибута, по которому задается условие
+
+        Декодируется только значение заданного атрибута каждой строки
+        (см. logic.condition()).
+
+        Возвращает список позиций подходящих строк.
+        '''
+        if item == 0:
+            position = bisect.bisect_left(self.numbers, value)
+            if (position < len(self.numbers)
+                    and self.numbers[position] == value):
+                return [position]
+            for position, items in enumerate(self.added, len(self.numbers)):
+                if items[0] == value:
+                    return [position]
+            return []
+
+        found = []
+        for position in range(len(self)):
+            stored = self.value(position, item)
+            if stored is not None and log.condition(item, stored, value):
+                found.append(position)
+
+        return found
+
+    def get(self, item: int, value: str | int) -> tasks.Tasks:
+        '''Получение объекта с задачами, подходящими по условию.
+
+        > self - ссылка на объект
+        > item - индекс атрибута в задаче, по которому задается условие
+        > value - значение атрибута, по которому задается условие
+
+        Задачи целиком декодируются только для подходящих строк.
+
+        Возвращает объект класса Tasks с задачами, подходящими по условию.
+        '''
+        tasklist = tasks.Tasks(tasks.INDEXED)
+
+        for position in self.positions(item, value):
+            items = self.row(position)
+            if items is not None:
+                tasklist.insert(items)
+
+        return tasklist
+
+    def get_task(self, item: int, value: str | int) -> list:
+        '''Поиск первой подходящей по значению задачи.
+
+        > self - ссылка на объект
+        > item - индекс атрибута задачи
+        > value - значение атрибута задачи, по которому происходит поиск
+
+        Возвращает список значений атрибутов найденной задачи, если
+        же задача не была найдена вызывает исключение TaskNotFoundError.
+        '''
+        for position in self.positions(item, value):
+            items = self.row(position)
+            if items is not None and (item != 7 or items[7] == value):
+                return items
+
+        raise tasks.TaskNotFoundError((item, value))
+
+    def load(self) -> tasks.Tasks:
+        '''Декодирование всех задач в объект класса Tasks.
+
+        > self - ссылка на объект
+
+        Возвращает объект класса Tasks со всеми задачами с корректными
+        значениями атрибутов (например, для их редактирования).
+        '''
+        tasklist = tasks.Tasks(tasks.INDEXED)
+
+        for items in self.rows():
+            tasklist.insert(items)
+
+        return tasklist
+
+    def print(self) -> None:
+        '''Вывод содержимого списка задач на экран.
+
+        > self - ссылка на объект
+
+        Для вывода все задачи декодируются (см. load()).
+
+        Ничего не возвращает.
+        '''
+        self.load().print()
+
+    def write(self, path: str) -> None:
+        '''Запись данных из объекта в файл (см. tasks.dump()).
+
+        > self - ссылка на объект
+        > path - путь, по которому необходимо записать файл
+
+        Задачи декодируются по одной в процессе записи. Запись в тот же
+        файл, из которого читается объект, допустима: файл заменяется
+        целиком, а отображение продолжает ссылаться на прежний файл.
+
+        Ничего не возвращает.
+        '''
+        tasks.dump(path, self.rows())
+
+    def close(self) -> None:
+        '''Закрытие отображения файла.
+
+        > self - ссылка на объект
+
+        Ничего не возвращает.
+        '''
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        self.data = b""
+
+    def overlay(self, records: list) -> None:
+        '''Применение записей журнала изменений к объекту без записи в файл.
+
+        > self - ссылка на объект
+        > records - строки записей журнала (см. tasks.Tasks.save())
+
+        Записи разбираются так же, как в tasks.Tasks.replay(), и
+        применяются в том же порядке и с теми же правилами: удаленные
+        строки файла исключаются из массивов смещений, измененные задачи
+        запоминаются по позициям строк, добавленные - в конце объекта.
+        В итоге задачи (см. rows()) совпадают с задачами объекта,
+        прочитанного tasks.Tasks.read().
+
+        Ничего не возвращает.
+        '''
+        # 'ID' -> атрибуты задачи или None (удалена) для строк файла,
+        # 'ID' -> атрибуты задачи для добавленных задач.
+        changed = {}
+        added = {}
+
+        for string in records:
+            parsed = tasks.record(string)
+            if parsed is None:
+                continue
+
+            operation, index, items = parsed
+            if index in added:
+                exists = True
+            elif index in changed:
+                exists = changed[index] is not None
+            else:
+                position = self.positions(0, index)
+                exists = bool(position) and self.row(position[0]) is not None
+
+            if operation == "remove" and exists:
+                if index in added:
+                    del added[index]
+                else:
+                    changed[index] = None
+            elif operation == "add" and not exists:
+                # Строка файла с тем же 'ID' (некорректная) больше
+                # не соответствует задаче.
+                changed.setdefault(index, None)
+                added[index] = items
+            elif operation == "edit" and exists:
+                if index in added:
+                    added[index] = items
+                else:
+                    changed[index] = items
+
+        removed = {index for index, items in changed.items() if items is None}
+        if removed:
+            kept = [position for position, index in enumerate(self.numbers)
+                    if index not in removed]
+            self.starts = array.array('q', (self.starts[position]
+                                            for position in kept))
+            self.ends = array.array('q', (self.ends[position]
+                                          for position in kept))
+            self.numbers = array.array('l', (self.numbers[position]
+                                             for position in kept))
+
+        for index, items in changed.items():
+            if items is not None:
+                self.changed[self.positions(0, index)[0]] = items
+        self.added = list(added.values())
+
+    def read(path: str):
+        '''Чтение из файла в объект класса MappedTasks.
+
+        > path - путь, по которому находится файл
+
+        Файл отображается в память, строки находятся поиском символов
+        перевода строки, в каждой строке находятся разделители '|'.
+        Строки с неправильным количеством значений сразу же отбрасываются
+        с тем же сообщением, что и при обычном чтении (см. tasks.stream()).
+
+        Затем к объекту применяются изменения из журнала файла (см.
+        overlay()), сам файл не изменяется.
+
+        Возвращает новый объект класса MappedTasks.
+        '''
+        obj = MappedTasks()
+
+        with open(path, "rb") as file:
+            # Пустой файл не может быть отображен в память.
+            if file.seek(0, 2) != 0:
+                obj.data = mmap.mmap(file.fileno(), 0,
+                                     access=mmap.ACCESS_READ)
+
+        data = obj.data
+        size = len(data)
+        start = 0
+        index = 0
+
+        while start < size:
+            end = data.find(b"\n", start)
+            if end == -1:
+                end = size
+            index += 1
+
+            # Разделители считаются, пока их не станет больше, чем нужно.
+            separators = 0
+            stop = data.find(b"|", start, end)
+            while stop != -1 and separators <= 6:
+                separators += 1
+                stop = data.find(b"|", stop + 1, end)
+            if separators < 6:
+                print(f"Задача ID:{index} -> Не хватает данных!")
+            elif separators > 6:
+                print(f"Задача ID:{index} -> Слишком много данных!")
+            else:
+                obj.starts.append(start)
+                obj.ends.append(end)
+                obj.numbers.append(index)
+
+            start = end + 1
+
+        records = journal.load(path)
+        if records:
+            obj.overlay(records)
+
+        return obj
+
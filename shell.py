@@ -1,6 +1,18 @@
+import heapq
+import operator
+
 import tasks
 
 
+class SequenceError(Exception):
+    '''Класс исключения.
+
+    Возникает в случае, когда запрошена неизвестная последовательность
+    шагов для сортировки Шелла.
+    '''
+    pass
+
+
 def hibbard(k: int) -> int:
     '''Формула Хиббарда для сортировки Шелла.
 
@@ -11,6 +23,70 @@ def hibbard(k: int) -> int:
     return 2 ** k - 1
 
 
+def ciura(k: int) -> int:
+    '''Последовательность Циуры для сортировки Шелла.
+
+    > k - номер шага (начиная с 1)
+
+    Первые значения получены Циурой эмпирически, последующие
+    вычисляются умножением предыдущего шага на 2.25.
+
+    Возвращает значение k-го шага последовательности.
+    '''
+    steps = [1, 4, 10, 23, 57, 132, 301, 701, 1750]
+
+    if k <= len(steps):
+        return steps[k - 1]
+
+    return int(ciura(k - 1) * 2.25)
+
+
+def tokuda(k: int) -> int:
+    '''Формула Токуды для сортировки Шелла.
+
+    > k - номер шага (начиная с 1)
+
+    Возвращает значение ceil((9^k - 4^k) / (5 * 4^(k-1))).
+    '''
+    return -(-(9 ** k - 4 ** k) // (5 * 4 ** (k - 1)))
+
+
+# Доступные последовательности шагов сортировки Шелла.
+sequences = {"hibbard": hibbard, "ciura": ciura, "tokuda": tokuda}
+
+
+def gaps(length: int, sequence: str = "hibbard") -> list:
+    '''Формирование шагов сортировки Шелла для списка заданной длины.
+
+    > length - длина сортируемого списка
+    > sequence - название последовательности шагов
+    ("hibbard" - по умолчанию, "ciura", "tokuda")
+
+    Начальный шаг выбирается как наибольший член последовательности,
+    меньший длины списка, поэтому на больших списках сортировка
+    не вырождается в сортировку вставками.
+
+    Возвращает список шагов в порядке убывания, если же последовательность
+    неизвестна вызывает исключение SequenceError.
+    '''
+    if sequence not in sequences:
+        raise SequenceError(sequence)
+
+    formula = sequences[sequence]
+    steps = []
+
+    k = 1
+    gap = formula(k)
+    while gap < length:
+        steps.append(gap)
+        k += 1
+        gap = formula(k)
+
+    steps.reverse()
+
+    return steps
+
+
 def compare(element1: str | int, element2: str | int, reverse: bool) -> bool:
     '''Сравнение двух элементов с учетом параметра reverse
 
@@ -26,50 +102,182 @@ def compare(element1: str | int, element2: str | int, reverse: bool) -> bool:
     return element1 < element2 if reverse else element1 > element2
 
 
+def invert(value: str | int) -> tuple | int:
+    '''Обращение порядка значения ключа сортировки.
+
+    > value - значение атрибута задачи типа str | int
+
+    Для чисел меняется знак, строка заменяется кортежем кодов её символов
+    с обратным знаком. Завершающая единица в кортеже нужна для того, чтобы
+    строка, являющаяся началом другой, оказывалась после неё.
+
+    Возвращает значение, сравнение которого обратно сравнению value.
+    '''
+    if isinstance(value, int):
+        return -value
+
+    return tuple(-ord(symbol) for symbol in value) + (1,)
+
+
+def compile_keys(keys: list):
+    '''Формирование функции составного ключа из любого количества ключей.
+
+    > keys - список кортежей (индекс атрибута задачи, признак сортировки
+    по убыванию), начиная с первичного ключа
+
+    Ключи, направление которых отличается от направления первичного,
+    обращаются с помощью invert(), так что весь список упорядочивается
+    по составному ключу в направлении первичного ключа. Если все
+    направления совпадают, ключом служит operator.itemgetter().
+
+    Возвращает функцию, вычисляющую составной ключ для задачи.
+    '''
+    reverse = keys[0][1]
+    items = tuple(item for item, _ in keys)
+
+    if all(direction == reverse for _, direction in keys):
+        return operator.itemgetter(*items)
+
+    inverted = tuple((item, direction != reverse) for item, direction in keys)
+
+    return lambda task: tuple(invert(task[item]) if flip else task[item]
+                              for item, flip in inverted)
+
+
+def composite(keys: tuple, reverse1: bool = False,
+              reverse2: bool = False):
+    '''Формирование функции составного ключа сортировки.
+
+    > keys - кортеж (keys[0] - первичный ключ сортировки, keys[1] - вторичный)
+    > reverse1, reverse2 - направления сортировки по ключам (см. sort())
+
+    Возвращает функцию, вычисляющую составной ключ для задачи
+    (см. compile_keys()).
+    '''
+    k1, k2 = keys
+
+    return compile_keys([(k1, reverse1), (k2, reverse2)])
+
+
+def multi_sort(obj: tasks.Tasks, keys: list) -> None:
+    '''Сортировка по любому количеству ключей.
+
+    > obj - объект класса Tasks, obj.list необходимо отсортировать
+    > keys - список ключей с направлениями (см. compile_keys())
+
+    Ключ вычисляется для каждой задачи один раз, после чего список
+    упорядочивается встроенной устойчивой сортировкой за O(n log n).
+    Перед сортировкой список отделяется от копий объекта (см.
+    Tasks.unshare()), после - обновляются позиции задач в индексе 'ID'.
+
+    Ничего не возвращает.
+    '''
+    obj.unshare()
+    obj.list.sort(key=compile_keys(keys), reverse=keys[0][1])
+    obj.reposition()
+
+
+def key_sort(obj: tasks.Tasks, keys: tuple,
+             reverse1: bool = False, reverse2: bool = False) -> None:
+    '''Сортировка по заранее вычисленному составному ключу.
+
+    > obj - объект класса Tasks, obj.list необходимо отсортировать
+    > keys - кортеж (keys[0] - первичный ключ сортировки, keys[1] - вторичный)
+    > reverse1, reverse2 - направления сортировки по ключам (см. sort())
+
+    Ничего не возвращает (см. multi_sort()).
+    '''
+    k1, k2 = keys
+    multi_sort(obj, [(k1, reverse1), (k2, reverse2)])
+
+
+def multi_top(obj: tasks.Tasks, keys: list, limit: int) -> tasks.Tasks:
+    '''Выбор первых задач в порядке сортировки без сортировки всего списка.
+
+    > obj - объект класса Tasks, из которого выбираются задачи
+    > keys - список ключей с направлениями (см. compile_keys())
+    > limit - количество выбираемых задач
+
+    Задачи выбираются кучей размера limit (см. модуль heapq) по тому же
+    составному ключу, что и в multi_sort(), за время O(n log limit).
+    Задачи с равными ключами остаются в исходном порядке.
+
+    Возвращает новый объект класса Tasks с не более чем limit задачами,
+    упорядоченными так же, как после сортировки всего списка.
+    '''
+    select = heapq.nlargest if keys[0][1] else heapq.nsmallest
+    tasklist = tasks.Tasks(obj.indexed)
+    tasklist.sources = obj.sources
+
+    for task in select(limit, obj.list, key=compile_keys(keys)):
+        tasklist.insert(task)
+
+    return tasklist
+
+
+def top(obj: tasks.Tasks, keys: tuple, limit: int,
+        reverse1: bool = False, reverse2: bool = False) -> tasks.Tasks:
+    '''Выбор первых задач в порядке сортировки по двум ключам.
+
+    > obj - объект класса Tasks, из которого выбираются задачи
+    > keys - кортеж (keys[0] - первичный ключ сортировки, keys[1] - вторичный)
+    > limit - количество выбираемых задач
+    > reverse1, reverse2 - направления сортировки по ключам (см. sort())
+
+    Возвращает новый объект класса Tasks (см. multi_top()).
+    '''
+    k1, k2 = keys
+
+    return multi_top(obj, [(k1, reverse1), (k2, reverse2)], limit)
+
+
 def sort(obj: tasks.Tasks, keys: tuple,
-         k: int = 4, reverse1: bool = False,
-         reverse2: bool = False) -> None:
+         reverse1: bool = False, reverse2: bool = False,
+         sequence: str = "hibbard") -> None:
     '''Сортировка Шелла.
 
     > obj - объект класса Tasks, obj.list необходимо отсортировать
     > keys - кортеж (keys[0] - первичный ключ сортировки, keys[1] - вторичный)
-    > (опционально) k - номер текущего шага (4 - по умолчанию),
-    значение, с помощью hibbard(k) задающее расстояние сравниваемых элементов.
     > (опционально) reverse1 - булево значение, означающее необходимость
     сортировки по убыванию по первичному ключу: (False - по умолчанию)
     > (опционально) reverse2 - булево значение, означающее необходимость
     сортировки по убыванию по вторичному ключу: (False - по умолчанию)
+    > (опционально) sequence - название последовательности шагов,
+    задающей расстояние сравниваемых элементов ("hibbard" - по умолчанию),
+    либо "key" - сортировка по составному ключу (см. key_sort())
 
-    Возвращает рекурсивный вызов этой же функции с уменьшением номера шага
-    или ничего, если сортировка окончена.
-    '''
+    Шаги перебираются в цикле, начиная с наибольшего подходящего
+    для длины списка (см. gaps()). Перед сортировкой список отделяется
+    от копий объекта (см. Tasks.unshare()), после - обновляются позиции
+    задач в индексе 'ID'.
 
-    if k == 0:
-        return
-
-    gap = hibbard(k)
-    if gap >= len(obj.list):
-        return sort(obj, keys, k-1, reverse1, reverse2)
+    Ничего не возвращает.
+    '''
+    if sequence == "key":
+        return key_sort(obj, keys, reverse1, reverse2)
 
+    obj.unshare()
     k1, k2 = keys
+    tasklist = obj.list
 
-    for index1 in range(gap, len(obj.list)):
-        temp = obj.list[index1]
-        index2 = index1
+    for gap in gaps(len(tasklist), sequence):
+        for index1 in range(gap, len(tasklist)):
+            temp = tasklist[index1]
+            index2 = index1
 
-        while index2 >= gap:
-            if obj.list[index2 - gap][k1] == temp[k1]:
-                if compare(obj.list[index2 - gap][k2], temp[k2], reverse2):
-                    obj.list[index2] = obj.list[index2 - gap]
+            while index2 >= gap:
+                if tasklist[index2 - gap][k1] == temp[k1]:
+                    if compare(tasklist[index2 - gap][k2], temp[k2], reverse2):
+                        tasklist[index2] = tasklist[index2 - gap]
+                        index2 -= gap
+                    else:
+                        break
+                elif compare(tasklist[index2 - gap][k1], temp[k1], reverse1):
+                    tasklist[index2] = tasklist[index2 - gap]
                     index2 -= gap
                 else:
                     break
-            elif compare(obj.list[index2 - gap][k1], temp[k1], reverse1):
-                obj.list[index2] = obj.list[index2 - gap]
-                index2 -= gap
-            else:
-                break
 
-        obj.list[index2] = temp
+            tasklist[index2] = temp
 
-    return sort(obj, keys, k-1, reverse1, reverse2)
+    obj.reposition()
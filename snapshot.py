@@ -0,0 +1,147 @@
+import array
+import os
+import struct
+import sys
+import zlib
+
+
+# Заголовок снимка: сигнатура, версия формата, размер и время изменения
+# текстового файла (в наносекундах), количество задач и контрольная сумма
+# остальной части снимка.
+HEADER = struct.Struct("<4sHqqII")
+MAGIC = b"FMSN"
+VERSION = 1
+
+# Типы элементов столбцов с датами и временем (получения/выполнения).
+TYPECODES = ("i", "h", "i", "h")
+
+
+def snapshot_path(path: str) -> str:
+    '''Получение пути к снимку базы данных.
+
+    > path - путь к текстовому файлу с базой данных
+
+    Возвращает путь к файлу снимка, лежащему рядом с текстовым файлом.
+    '''
+    return path + ".snap"
+
+
+def stamp(path: str) -> tuple:
+    '''Получение отметки о состоянии текстового файла.
+
+    > path - путь к текстовому файлу с базой данных
+
+    Возвращает кортеж (размер файла, время изменения в наносекундах),
+    если файла не существует вызывает исключение FileNotFoundError.
+    '''
+    status = os.stat(path)
+
+    return status.st_size, status.st_mtime_ns
+
+
+def column(typecode: str, values) -> bytes:
+    '''Кодирование столбца чисел в байты.
+
+    > typecode - тип элементов столбца (см. модуль array)
+    > values - значения столбца
+
+    Числа всегда записываются в порядке little-endian.
+
+    Возвращает байты столбца.
+    '''
+    values = array.array(typecode, values)
+    if sys.byteorder == "big":
+        values.byteswap()
+
+    return values.tobytes()
+
+
+def save(path: str, tasklist: list) -> None:
+    '''Запись снимка базы данных рядом с текстовым файлом.
+
+    > path - путь к уже записанному текстовому файлу с базой данных
+    > tasklist - список задач, записанный в текстовый файл
+
+    Даты, время, исполнители, задачи и статусы записываются отдельными
+    столбцами, исполнитель и задача - номерами строк в таблице строк.
+    Значения 'ID' не записываются: при чтении текстового файла ими
+    являются номера строк, то есть позиции задач, начиная с единицы.
+    Снимок записывается во временный файл, который затем заменяет
+    прежний снимок (см. tasks.dump()).
+
+    Ничего не возвращает.
+    '''
+    strings = []
+    codes = {}
+    for task in tasklist:
+        for item in (5, 6):
+            if task[item] not in codes:
+                codes[task[item]] = len(strings)
+                strings.append(task[item])
+
+    payload = [column(typecode, (task[item] for task in tasklist))
+               for item, typecode in enumerate(TYPECODES, 1)]
+    for item in (5, 6):
+        payload.append(column("i", (codes[task[item]] for task in tasklist)))
+    payload.append(bytes(ord(task[7]) for task in tasklist))
+    payload.append("\n".join(strings).encode("utf-8"))
+    payload = b"".join(payload)
+
+    size, mtime = stamp(path)
+    header = HEADER.pack(MAGIC, VERSION, size, mtime,
+                         len(tasklist), zlib.crc32(payload))
+
+    temp_path = snapshot_path(path) + ".tmp"
+    with open(temp_path, "wb") as file:
+        file.write(header)
+        file.write(payload)
+        file.flush()
+        os.fsync(file.fileno())
+
+    os.replace(temp_path, snapshot_path(path))
+
+
+def load(path: str) -> list | None:
+    '''Чтение задач из снимка базы данных.
+
+    > path - путь к текстовому файлу с базой данных
+
+    Снимок используется, только если его сигнатура и версия совпадают
+    с ожидаемыми, отметка текстового файла (см. stamp()) совпадает с
+    записанной в снимке и контрольная сумма верна.
+
+    Возвращает список списков атрибутов задач (уже отформатированных,
+    см. tasks.Tasks), или None, если снимок отсутствует или устарел.
+    '''
+    try:
+        with open(snapshot_path(path), "rb") as file:
+            data = file.read()
+        magic, version, size, mtime, count, checksum = \
+            HEADER.unpack_from(data)
+        current = stamp(path)
+    except (OSError, struct.error):
+        return None
+
+    if (magic != MAGIC or version != VERSION or (size, mtime) != current
+            or zlib.crc32(memoryview(data)[HEADER.size:]) != checksum):
+        return None
+
+    offset = HEADER.size
+    columns = []
+    for typecode in TYPECODES + ("i", "i"):
+        values = array.array(typecode)
+        end = offset + values.itemsize * count
+        values.frombytes(data[offset:end])
+        if sys.byteorder == "big":
+            values.byteswap()
+        columns.append(values)
+        offset = end
+
+    statuses = data[offset:offset + count].decode("ascii")
+    strings = data[offset + count:].decode("utf-8").split("\n")
+
+    return [[index, recv_date, recv_time, due_date, due_time,
+             strings[executor], strings[task], status]
+            for index, (recv_date, recv_time, due_date, due_time,
+                        executor, task, status)
+            in enumerate(zip(*columns, statuses), 1)]
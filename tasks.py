@@ -1,4 +1,65 @@
+import bisect
+import concurrent.futures
+import heapq
+import io
+import itertools
+import os
+import sys
+
+import journal
 import logic as log
+import snapshot
+import validator
+
+
+# Атрибуты задачи, по значениям которых строятся индексы при чтении файла:
+# дата получения, дата выполнения, исполнитель, задача и статус.
+INDEXED = (1, 3, 5, 6, 7)
+
+# Статусы задач на исполнении ('Получена' и 'В процессе').
+RUNNING = ('b', 'c')
+# Статус проваленных задач.
+FAILED = 'a'
+
+# Количество удалений задач, после которого позиции в индексе 'ID'
+# пересчитываются целиком (см. Tasks.remove()).
+REPOSITION_LIMIT = 1024
+
+# Количество строк, накапливаемых перед одной записью в файл.
+WRITE_CHUNK = 10000
+
+# Количество строк файла, проверяемых за один раз при чтении (см. stream()).
+READ_CHUNK = 10000
+
+# Количество процессов для параллельного чтения файла (см. load()):
+# 0 - файл читается в текущем процессе. Наименьший размер части файла,
+# обрабатываемой одним процессом, в байтах.
+WORKERS = 0
+PARALLEL_CHUNK = 1 << 22
+
+# Атрибуты задачи, длины значений которых отслеживаются для вывода
+# таблицы, и соответствующие им столбцы таблицы.
+MEASURED = {0: 0, 5: 3, 6: 4}
+
+# Записывать ли рядом с файлом базы данных двоичный снимок при сохранении
+# и читать ли задачи из него, если он соответствует файлу (см. snapshot).
+SNAPSHOTS = True
+
+# Наибольшее количество записей в журнале изменений (см. save()): при
+# большем количестве файл базы данных записывается целиком, а журнал
+# удаляется.
+JOURNAL_LIMIT = 1000
+
+# Выводить ли таблицу задач на экран по страницам (включается командой
+# pager) и количество задач на одной странице.
+PAGING = False
+PAGE_SIZE = 20
+
+# Заголовки столбцов таблицы задач.
+HEADER = ["ID", "Получена", "Выполнить", "Исполнитель", "Задача", "Статус"]
+
+# Заголовок столбца с файлом задачи в объединенной базе данных (см. merge()).
+SOURCE_HEADER = "Файл"
 
 
 class TaskNotFoundError(Exception):
@@ -16,17 +77,269 @@ class Tasks:
     является отдельной задачей.
     Класс помогает структурировать список задач, сделать удобным
     взаимодействие с ним.
+
+    Списки атрибутов задач никогда не изменяются на месте: при
+    редактировании задача заменяется новым списком. Поэтому копии
+    объекта и результаты поиска разделяют списки атрибутов задач,
+    а копия объекта разделяет с исходным и сам список задач с индексами,
+    пока один из них не будет изменен (см. unshare()).
     '''
-    def __init__(self) -> None:
+    def __init__(self, indexed: tuple = ()) -> None:
         '''Инициализация объекта.
 
         > self - ссылка на инициализируемый объект
+        > indexed - индексы атрибутов задачи, по значениям которых
+        необходимо вести индексы (() - по умолчанию)
 
-        Инициализирует список объекта.
+        Инициализирует список объекта, индекс 'ID' задач и индексы
+        по значениям атрибутов.
 
         Ничего не возвращает.
         '''
         self.list = []
+        # Соответствие значения атрибута 'ID' задачи и её позиции в списке.
+        # После удалений позиции в индексе не пересчитываются сразу:
+        # упорядоченный список позиций (в том же индексе) удаленных задач,
+        # по которому вычисляется настоящая позиция (см. position()).
+        self.ids = {}
+        self.removed = []
+        # Для каждого индексируемого атрибута: значение атрибута ->
+        # множество значений 'ID' задач с таким значением.
+        self.indexed = indexed
+        self.indexes = {item: {} for item in indexed}
+        # Если индексируется дата получения, дополнительно ведется
+        # упорядоченный список кортежей (дата получения, статус, 'ID').
+        # Новые записи добавляются в конец, а список упорядочивается
+        # при первом обращении к нему (см. arrange()).
+        self.dates = []
+        # Если индексируется статус, так же ведется список кортежей
+        # (исполнитель, дата выполнения, 'ID') задач на исполнении
+        # (статусы 'Получена' и 'В процессе'), см. progress().
+        self.running = []
+        self.ordered = True
+        # Так же для каждого исполнителя ведется список кортежей (дата
+        # выполнения со знаком минус, задача, 'ID') его проваленных задач
+        # (см. failures()). Множество исполнителей, в списки которых
+        # добавлялись меньшие записи, упорядочиваемые в arrange().
+        self.failed = {}
+        self.unordered = set()
+        # Свободные значения 'ID': куча значений меньше наибольшего
+        # использованного (top), которые были или могут быть свободны.
+        # Занятые значения удаляются из кучи только при поиске (free_id()).
+        # Пропуски между 'ID' добавляемых задач попадают в кучу только при
+        # поиске и только выше уже просмотренного значения (scanned), так
+        # что у результатов поиска, где 'ID' идут с пропусками, куча пуста.
+        self.holes = []
+        self.top = 0
+        self.scanned = 0
+        # Для атрибутов из MEASURED: длина значения -> количество задач
+        # с такой длиной значения (для ширины столбцов, см. widths()).
+        self.lengths = {item: {} for item in MEASURED}
+        # Для объединенной базы данных (см. merge()): упорядоченный список
+        # пар (число, файл) - значения 'ID' задач файла равны этому числу
+        # плюс номер строки в файле. Список общий для всех объектов,
+        # полученных из объединенного (копий и результатов поиска).
+        self.sources = []
+        # Номер (с нуля) страницы таблицы, выводимой на экран (см. print()).
+        self.page = 0
+        # Изменения, еще не записанные в журнал (см. save()): список пар
+        # (операция, атрибуты задачи или 'ID'), или None, если изменения
+        # не отслеживаются.
+        self.journal = None
+        # Признак того, что список задач и индексы общие с другим объектом.
+        self.shared = False
+
+    def unshare(self) -> None:
+        '''Отделение списка задач и индексов от других объектов.
+
+        > self - ссылка на объект
+
+        Вызывается перед любым изменением списка задач или индексов.
+        Если они общие с копией объекта, то копируются сами контейнеры,
+        списки атрибутов задач остаются общими.
+
+        Ничего не возвращает.
+        '''
+        if not self.shared:
+            return
+
+        self.list = self.list[:]
+        self.ids = self.ids.copy()
+        self.removed = self.removed[:]
+        self.indexes = {item: {key: bucket.copy() for key, bucket
+                               in self.indexes[item].items()}
+                        for item in self.indexed}
+        self.dates = self.dates[:]
+        self.running = self.running[:]
+        self.failed = {executor: bucket[:]
+                       for executor, bucket in self.failed.items()}
+        self.unordered = self.unordered.copy()
+        self.holes = self.holes[:]
+        self.lengths = {item: self.lengths[item].copy() for item in MEASURED}
+        self.shared = False
+
+    def index(self, task: list) -> None:
+        '''Добавление задачи в индексы по значениям атрибутов.
+
+        > self - ссылка на объект
+        > task - атрибуты задачи
+
+        Ничего не возвращает.
+        '''
+        for item in self.indexed:
+            self.indexes[item].setdefault(task[item], set()).add(task[0])
+
+        if 1 in self.indexes:
+            entry = (task[1], task[7], task[0])
+            if self.dates and entry < self.dates[-1]:
+                self.ordered = False
+            self.dates.append(entry)
+
+        if 7 in self.indexes and task[7] in RUNNING:
+            entry = (task[5], task[3], task[0])
+            if self.running and entry < self.running[-1]:
+                self.ordered = False
+            self.running.append(entry)
+
+        if 7 in self.indexes and task[7] == FAILED:
+            bucket = self.failed.setdefault(task[5], [])
+            entry = (-task[3], task[6], task[0])
+            if bucket and entry < bucket[-1]:
+                self.unordered.add(task[5])
+            bucket.append(entry)
+
+        for item in MEASURED:
+            lengths = self.lengths[item]
+            length = len(str(task[item]))
+            lengths[length] = lengths.get(length, 0) + 1
+
+    def unindex(self, task: list) -> None:
+        '''Удаление задачи из индексов по значениям атрибутов.
+
+        > self - ссылка на объект
+        > task - атрибуты задачи
+
+        Ничего не возвращает.
+        '''
+        for item in self.indexed:
+            bucket = self.indexes[item][task[item]]
+            bucket.discard(task[0])
+            if not bucket:
+                del self.indexes[item][task[item]]
+
+        if 1 in self.indexes:
+            self.arrange()
+            entry = (task[1], task[7], task[0])
+            del self.dates[bisect.bisect_left(self.dates, entry)]
+
+        if 7 in self.indexes and task[7] in RUNNING:
+            self.arrange()
+            entry = (task[5], task[3], task[0])
+            del self.running[bisect.bisect_left(self.running, entry)]
+
+        if 7 in self.indexes and task[7] == FAILED:
+            self.arrange()
+            bucket = self.failed[task[5]]
+            entry = (-task[3], task[6], task[0])
+            del bucket[bisect.bisect_left(bucket, entry)]
+            if not bucket:
+                del self.failed[task[5]]
+
+        for item in MEASURED:
+            lengths = self.lengths[item]
+            length = len(str(task[item]))
+            lengths[length] -= 1
+            if not lengths[length]:
+                del lengths[length]
+
+    def arrange(self) -> None:
+        '''Упорядочивание списков дат получения задач, задач на исполнении
+        и проваленных задач исполнителей.
+
+        > self - ссылка на объект
+
+        Сортировка выполняется, только если после последнего
+        упорядочивания в конец одного из списков были добавлены меньшие
+        записи. Уже упорядоченный список сортируется за линейное время,
+        списки проваленных задач сортируются только для исполнителей
+        из unordered.
+
+        Ничего не возвращает.
+        '''
+        if not self.ordered:
+            self.dates.sort()
+            self.running.sort()
+            self.ordered = True
+
+        for executor in self.unordered:
+            self.failed[executor].sort()
+        self.unordered.clear()
+
+    def matches(self, item: int, value: str | int) -> set:
+        '''Получение 'ID' задач, подходящих по условию, через индекс.
+
+        > self - ссылка на объект
+        > item - индекс индексируемого атрибута задачи
+        > value - значение атрибута, по которому задается условие
+
+        Для статуса условие проверяется для каждого из хранящихся
+        значений (их не больше четырех), см. logic.condition().
+
+        Возвращает множество значений 'ID' подходящих задач.
+        '''
+        if item == 7:
+            found = set()
+            for key, bucket in self.indexes[item].items():
+                if log.condition(item, key, value):
+                    found |= bucket
+            return found
+
+        return self.indexes[item].get(value, set())
+
+    def reposition(self, start: int = 0) -> None:
+        '''Обновление позиций задач в индексе 'ID'.
+
+        > self - ссылка на объект
+        > start - позиция, начиная с которой позиции задач
+        могли измениться (0 - по умолчанию)
+
+        Вызывается после сдвига или перестановки задач в списке. Позиции
+        задач до первой удаленной не менялись, поэтому при отложенных
+        удалениях (см. remove()) пересчет начинается не позже неё.
+
+        Ничего не возвращает.
+        '''
+        if self.removed:
+            start = min(start, self.removed[0])
+            self.removed = []
+
+        for position in range(start, len(self.list)):
+            self.ids[self.list[position][0]] = position
+
+    def position(self, index: int) -> int:
+        '''Получение позиции задачи в списке по значению атрибута 'ID'.
+
+        > self - ссылка на объект
+        > index - значение атрибута 'ID' задачи
+
+        Из позиции в индексе вычитается количество удаленных перед ней
+        задач (см. remove()). Если список был переставлен в обход методов
+        объекта (например, сортировкой), позиции в индексе пересчитываются.
+
+        Возвращает позицию задачи в списке задач, если же задача не была
+        найдена вызывает исключение TaskNotFoundError.
+        '''
+        if index not in self.ids:
+            raise TaskNotFoundError((0, index))
+
+        position = self.ids[index]
+        if self.removed:
+            position -= bisect.bisect_left(self.removed, position)
+        if position >= len(self.list) or self.list[position][0] != index:
+            self.reposition()
+            position = self.ids[index]
+
+        return position
 
     def items_check(self, items) -> bool:
         '''Проверка атрибутов задачи.
@@ -35,7 +348,9 @@ class Tasks:
         > items - атрибуты задачи
 
         Проверка атрибутов задачи на корректность:
-        (даты получения и выполнения, время, статус и т.д.).
+        (даты получения и выполнения, время, статус и т.д.)
+        (см. validator.validate()). Корректные атрибуты форматируются
+        на месте, об ошибке выводится сообщение.
 
         Возвращает булево значение (True/False),
         означающее соответствуют ли атрибуты правилам.
@@ -44,61 +359,12 @@ class Tasks:
         if len(items) != 8:
             raise log.ItemsError()
 
-        # Форматирование даты для эффективного сравнения строк в сортировке
-        try:
-            items[1] = log.date_format(items[1])
-        except log.DateError as exception:
-            date = exception.args[0]
-            print(f"Задача ID:{items[0]} -> Некорректная дата: {date}")
-            return False
-
-        try:
-            items[3] = log.date_format(items[3])
-        except log.DateError as exception:
-            date = exception.args[0]
-            print(f"Задача ID:{items[0]} -> Некорректная дата: {date}")
-            return False
-
-        # Проверка на корректность времени
-        try:
-            log.time_mask(items[2])
-        except log.TimeError as exception:
-            time = exception.args[0]
-            print(f"Задача ID:{items[0]} -> Некорректное время: {time}")
-            return False
-
-        try:
-            log.time_mask(items[4])
-        except log.TimeError as exception:
-            time = exception.args[0]
-            print(f"Задача ID:{items[0]} -> Некорректное время: {time}")
+        good, report = validator.validate([items])
+        if report:
+            validator.print_report(report)
             return False
 
-        # Дата выполнения не может быть меньше даты получения
-        if items[3] < items[1]:
-            print(f"Задача ID:{items[0]} -> Невозможное соотношение дат")
-            return False
-        # Если даты равны, то сравнивается время получения и выполнения
-        elif items[3] == items[1]:
-            if items[4] < items[2]:
-                print(f"Задача ID:{items[0]} -> Невозможное соотношение дат")
-                return False
-
-        if len(items[5]) == items[5].count(" "):
-            print(f"Задача ID:{items[0]} -> Пустое значение 'Исполнитель'")
-            return False
-
-        if len(items[6]) == items[6].count(" "):
-            print(f"Задача ID:{items[0]} -> Пустое значение 'Задача'")
-            return False
-
-        # Проверка на корректность статуса
-        try:
-            items[7] = log.status_format(items[7])
-        except log.StatusError as exception:
-            status = exception.args[0]
-            print(f"Задача ID:{items[0]} -> Некорректный статус: {status}")
-            return False
+        items[:] = good[0]
 
         return True
 
@@ -107,17 +373,109 @@ class Tasks:
 
         > self - ссылка на объект
 
-        Создается новый объект класса Tasks,
-        список задач копируется в новый объект.
+        Создается новый объект класса Tasks, разделяющий с исходным
+        список задач и индексы. Копирование происходит только при первом
+        изменении одного из объектов (см. unshare()), поэтому само
+        копирование не зависит от количества задач.
 
         Возвращает копию объекта класса Tasks.
         '''
-        copy = Tasks()
-        for task in self.list:
-            copy.list.append(task[:])
+        copy = Tasks(self.indexed)
+        copy.list = self.list
+        copy.ids = self.ids
+        copy.removed = self.removed
+        copy.indexes = self.indexes
+        copy.dates = self.dates
+        copy.running = self.running
+        copy.failed = self.failed
+        copy.unordered = self.unordered
+        copy.ordered = self.ordered
+        copy.holes = self.holes
+        copy.top = self.top
+        copy.scanned = self.scanned
+        copy.lengths = self.lengths
+        copy.sources = self.sources
+
+        self.shared = True
+        copy.shared = True
 
         return copy
 
+    def renumbered(self):
+        '''Получение объекта с задачами, пронумерованными по порядку.
+
+        > self - ссылка на объект
+
+        При чтении файла значением атрибута 'ID' задачи становится номер
+        её строки, поэтому объект, записанный в файл (см. write()), после
+        перенумерации совпадает с объектом, прочитанным из этого файла.
+
+        Возвращает новый объект класса Tasks, в котором значения атрибута
+        'ID' задач равны их позициям в списке, начиная с единицы.
+        '''
+        tasklist = Tasks(self.indexed)
+
+        for position, task in enumerate(self.list, 1):
+            tasklist.insert([position] + task[1:])
+
+        return tasklist
+
+    def insert(self, items: list, index: int = None) -> None:
+        '''Вставка задачи в список без проверки атрибутов.
+
+        > self - ссылка на объект
+        > items - атрибуты задачи (уже проверенные и отформатированные)
+        > index - желательный индекс задачи в списке (None - по умолчанию)
+
+        Если index = None, то задача добавляется в конец списка задач.
+        Индекс 'ID' обновляется только для сдвинутых задач.
+
+        Ничего не возвращает.
+        '''
+        self.unshare()
+        self.index(items)
+
+        if self.journal is not None:
+            self.journal.append(("add", items))
+
+        if items[0] > self.top:
+            self.top = items[0]
+
+        if index is None or index >= len(self.list):
+            # Все удаленные задачи находятся перед новой (см. position()).
+            self.ids[items[0]] = len(self.list) + len(self.removed)
+            self.list.append(items)
+        else:
+            self.list.insert(index, items)
+            self.reposition(index)
+
+    def free_id(self) -> int:
+        '''Нахождение минимального свободного 'ID' для новой задачи.
+
+        > self - ссылка на объект
+
+        Сначала в кучу свободных значений добавляются еще не просмотренные
+        пропуски между 'ID' задач (каждое значение просматривается один
+        раз). Из кучи удаляются значения, занятые после попадания в неё,
+        затем берется наименьшее. Если куча пуста, свободным является
+        значение, следующее за наибольшим.
+
+        Возвращает число - значение минимального свободного 'ID'.
+        '''
+        if self.scanned < self.top:
+            for hole in range(self.scanned + 1, self.top):
+                if hole not in self.ids:
+                    heapq.heappush(self.holes, hole)
+            self.scanned = self.top
+
+        while self.holes and self.holes[0] in self.ids:
+            heapq.heappop(self.holes)
+
+        if self.holes:
+            return self.holes[0]
+
+        return self.top + 1
+
     def add(self, items: list, index: int = None) -> bool:
         '''Добавление задачи в список.
 
@@ -134,11 +492,8 @@ class Tasks:
         '''
         good_items = self.items_check(items)
 
-        if index is None:
-            index = len(self.list)
-
         if good_items:
-            self.list.insert(index, items)
+            self.insert(items, index)
 
         return good_items
 
@@ -148,22 +503,54 @@ class Tasks:
         > self - ссылка на объект
         > index - значение атрибута 'ID' задачи
 
-        По значению атрибута 'ID' осуществляется доступ
-        к задаче, которую необходимо удалить.
+        По значению атрибута 'ID' через индекс находится позиция
+        задачи, которую необходимо удалить. Позиции следующих задач
+        в индексе не пересчитываются: позиция удаленной задачи (в индексе)
+        добавляется в упорядоченный список удаленных (см. position()),
+        а весь индекс пересчитывается только после REPOSITION_LIMIT
+        удалений. Сдвиг задач в самом списке по-прежнему занимает время,
+        пропорциональное их количеству, но выполняется одним копированием
+        памяти, без цикла на Python.
 
         Возвращает булево значение (True/False), означающее
         удалилась ли задача из списка задач.
         '''
-        removed = False
+        try:
+            position = self.position(index)
+        except TaskNotFoundError:
+            return False
 
-        for task in self.list:
-            # 0 - индекс, по которому в задаче всегда находится атрибут 'ID'
-            if task[0] == index:
-                self.list.remove(task)
-                removed = True
-                break
+        self.unshare()
+        self.unindex(self.list.pop(position))
+        if self.journal is not None:
+            self.journal.append(("remove", index))
+        bisect.insort(self.removed, self.ids.pop(index))
+        if len(self.removed) > REPOSITION_LIMIT:
+            self.reposition(position)
+        heapq.heappush(self.holes, index)
+
+        return True
+
+    def replace(self, position: int, items: list) -> None:
+        '''Замена задачи на заданной позиции без проверки атрибутов.
 
-        return removed
+        > self - ссылка на объект
+        > position - позиция задачи в списке задач
+        > items - новые атрибуты задачи (уже проверенные и отформатированные)
+
+        Значение атрибута 'ID' задачи при замене не меняется,
+        поэтому индекс 'ID' остается корректным, обновляются
+        только индексы по значениям атрибутов.
+
+        Ничего не возвращает.
+        '''
+        self.unshare()
+        self.unindex(self.list[position])
+        self.list[position] = items
+        self.index(items)
+
+        if self.journal is not None:
+            self.journal.append(("edit", items))
 
     def edit_item(self, index: int, item: int, value: str) -> bool:
         '''Редактирование значения атрибута задачи.
@@ -173,11 +560,10 @@ class Tasks:
         > item - индекс, по которому в задаче находится атрибут
         > value - новое значение указанного атрибута задачи
 
-        Найдя задачу с нужным 'ID' и сохранив ее индекс в списке
-        задач, формируется новый список атрибутов для добавления
-        новой задачи (старый список атрибутов, лишь с одним измененным
-        значением). Старая задача удаляется, измененная добавляется
-        по тому же индексу.
+        Найдя через индекс позицию задачи с нужным 'ID', формируется
+        новый список атрибутов (старый список атрибутов, лишь с одним
+        измененным значением). Если он проходит проверку, то задача
+        заменяется на той же позиции.
 
         Защита от некорректного значения атрибута обеспечивается
         средой, из которой вызывается этот метод.
@@ -188,16 +574,17 @@ class Tasks:
         Возвращает булево значение (True/False), означающее было ли
         изменено значение необходимого атрибута задачи.
         '''
-        edited = False
+        try:
+            position = self.position(index)
+        except TaskNotFoundError:
+            return False
 
-        for task_index in range(len(self.list)):
-            # 0 - индекс, по которому в задаче всегда находится атрибут 'ID'
-            if self.list[task_index][0] == index:
-                items = log.items_format(self.list[task_index])
-                items[item] = value
-                self.remove(index)
-                edited = self.add(items, task_index)
-                break
+        items = log.items_format(self.list[position][:])
+        items[item] = value
+
+        edited = self.items_check(items)
+        if edited:
+            self.replace(position, items)
 
         return edited
 
@@ -208,9 +595,8 @@ class Tasks:
         > index - значение атрибута 'ID' задачи
         > items - список измененных значений атрибутов задачи
 
-        Найдя задачу с соответствующим 'ID' и сохранив ее индекс
-        в списке задач, удаляется старая задача и добавляется новая
-        по этому же индексу.
+        Найдя через индекс позицию задачи с соответствующим 'ID',
+        старая задача заменяется новой на той же позиции.
 
         Защита от некорректности значений атрибутов обеспечивается
         средой, из которой вызывается этот метод.
@@ -218,49 +604,101 @@ class Tasks:
         Возвращается булево значение (True/False), означающее
         была ли изменена задача.
         '''
-        edited = False
+        try:
+            position = self.position(index)
+        except TaskNotFoundError:
+            return False
 
-        for task_index in range(len(self.list)):
-            if self.list[task_index][0] == index:
-                self.remove(index)
-                edited = self.add(items, task_index)
-                break
+        edited = self.items_check(items)
+        if edited:
+            self.replace(position, items)
 
         return edited
 
-    def print(self) -> None:
-        '''Вывод содержимого списка задач на экран.
+    def widths(self) -> list:
+        '''Формирование данных о максимальной длине значений всех атрибутов.
 
         > self - ссылка на объект
 
-        Собирается информация о предпочтительном формировании
-        строк с данными из списка задач.
+        Длины значений отслеживаются при каждом изменении списка задач
+        (см. index(), unindex()), поэтому просматриваются только
+        различные длины, а не все задачи.
 
-        Таким образом, пользователь увидит ровную таблицу задач.
+        Возвращает список с числовыми значениями максимальных длин.
+        '''
+        # Такие значения соответствуют либо длине заголовков, либо
+        # максимальной длине допустимых значений, они являются минимальными.
+        max_space = [2, 16, 16, 11, 6, 10]
 
-        Ничего не возвращает.
+        for item, column in MEASURED.items():
+            if self.lengths[item]:
+                max_space[column] = max(max_space[column],
+                                        max(self.lengths[item]))
+
+        # Для объединенной базы данных добавляется столбец с файлом.
+        if self.sources:
+            max_space.append(max(len(SOURCE_HEADER),
+                                 *(len(path) for _, path in self.sources)))
+
+        return max_space
+
+    def source(self, index: int) -> str | None:
+        '''Получение файла, из которого была прочитана задача.
+
+        > self - ссылка на объект
+        > index - значение атрибута 'ID' задачи
+
+        Возвращает путь к файлу для объединенной базы данных (см. merge()),
+        иначе - None.
         '''
-        # Информация о максимальной длине значений для каждого атрибута
-        if len(self.list) != 0:
-            max_space = log.max_space(self)
+        if not self.sources:
+            return None
+
+        return self.sources[bisect.bisect_left(self.sources, (index,)) - 1][1]
+
+    def pages(self) -> int:
+        '''Количество страниц таблицы задач.
+
+        > self - ссылка на объект
+
+        Возвращает число страниц по PAGE_SIZE задач (не меньше одной),
+        или единицу, если постраничный вывод выключен (см. PAGING).
+        '''
+        if not PAGING:
+            return 1
 
-            header_labels = [
-                "ID", "Получена",
-                "Выполнить", "Исполнитель",
-                "Задача", "Статус"
-                ]
+        return max(1, -(-len(self.list) // PAGE_SIZE))
 
-            print("\n"+log.string(max_space, header_labels))
+    def print(self) -> None:
+        '''Вывод списка задач или его текущей страницы на экран.
+
+        > self - ссылка на объект
 
-            for task in self.list:
-                # Для каждой задачи значения атрибутов форматируются
-                task_labels = [
-                    str(task[0]), f"{log.date_format(task[1])} {task[2]}",
-                    f"{log.date_format(task[3])} {task[4]}", task[5],
-                    task[6], log.status_format(task[7])
-                    ]
+        Если постраничный вывод выключен (см. PAGING), выводятся все
+        задачи. Иначе номер страницы (self.page) приводится к допустимому,
+        после чего форматируются только задачи этой страницы
+        (см. render()), а ширина
+        столбцов берется из отслеживаемых длин значений (см. widths()),
+        так что она одинакова на всех страницах.
+
+        Таким образом, пользователь увидит ровную таблицу задач.
 
-                print(log.string(max_space, task_labels))
+        Ничего не возвращает.
+        '''
+        if len(self.list) != 0:
+            pages = self.pages()
+            size = PAGE_SIZE if PAGING else len(self.list)
+            self.page = min(max(self.page, 0), pages - 1)
+            start = self.page * size
+            end = min(start + size, len(self.list))
+
+            sys.stdout.write(render(self.widths(), self.list[start:end],
+                                    self.source if self.sources else None))
+
+            if pages > 1:
+                print(f"Страница {self.page + 1} из {pages} "
+                      f"(задачи {start + 1}-{end} из {len(self.list)}), "
+                      "листать: next, prev, page")
         else:
             print("Список задач пуст!")
 
@@ -271,17 +709,132 @@ class Tasks:
         > item - индекс атрибута в задаче, по которому задается условие
         > value - значение атрибута, по которому задается условие
 
-        Создается новый объект, задачи, подходящие по условию добавляются
-        в список задач нового объекта в виде копий.
+        Возвращает копию объекта класса Tasks с задачами, подходящими по
+        условию (см. select()).
+        '''
+        return self.select([(item, value)])
+
+    def select(self, conditions: list):
+        '''Получение копии объекта с задачами, подходящими по всем условиям.
+
+        > self - ссылка на объект
+        > conditions - список пар (индекс атрибута, значение атрибута)
+
+        Для условий по 'ID' и по индексируемым атрибутам подходящие задачи
+        находятся через индексы (пересечением множеств 'ID'), остальные
+        условия проверяются только для найденных задач. Если ни одно
+        условие не покрыто индексом, просматривается весь список задач.
+
+        Создается новый объект, задачи, подходящие по условиям добавляются
+        в список задач нового объекта (списки атрибутов задач общие)
+        в порядке списка.
 
         Возвращает копию объекта класса Tasks с задачами, подходящими по
-        условию.
+        условиям.
         '''
-        tasklist = Tasks()
+        tasklist = Tasks(self.indexed)
+        tasklist.sources = self.sources
+
+        found = None
+        rest = []
+        for item, value in conditions:
+            if item == 0:
+                ids = {value} if value in self.ids else set()
+            elif item in self.indexes:
+                ids = self.matches(item, value)
+            else:
+                rest.append((item, value))
+                continue
+
+            found = ids.copy() if found is None else found & ids
+
+        if found is None:
+            candidates = self.list
+        else:
+            positions = sorted(self.position(index) for index in found)
+            candidates = [self.list[position] for position in positions]
 
-        for task in self.list:
-            if log.condition(item, task[item], value):
-                tasklist.list.append(task[:])
+        for task in candidates:
+            if all(log.condition(item, task[item], value)
+                   for item, value in rest):
+                tasklist.insert(task)
+
+        return tasklist
+
+    def period(self, first: int, last: int, limit: int = None):
+        '''Получение задач, полученных в заданный промежуток дат.
+
+        > self - ссылка на объект (с индексом по дате получения)
+        > first - первая дата промежутка (номер дня)
+        > last - последняя дата промежутка (номер дня)
+        > limit - наибольшее количество задач (None - все задачи)
+
+        Границы промежутка находятся двоичным поиском в упорядоченном
+        списке дат получения, поэтому задачи выбираются за время,
+        пропорциональное их количеству, сразу в нужном порядке.
+
+        Возвращает копию объекта класса Tasks с задачами, упорядоченными
+        по дате получения и статусу по убыванию.
+        '''
+        tasklist = Tasks(self.indexed)
+        tasklist.sources = self.sources
+
+        self.arrange()
+        start = bisect.bisect_left(self.dates, first, key=lambda x: x[0])
+        end = bisect.bisect_right(self.dates, last, key=lambda x: x[0])
+        if limit is not None:
+            start = max(start, end - limit)
+
+        for position in range(end - 1, start - 1, -1):
+            index = self.dates[position][2]
+            tasklist.insert(self.list[self.position(index)])
+
+        return tasklist
+
+    def progress(self, limit: int = None):
+        '''Получение задач, находящихся на исполнении.
+
+        > self - ссылка на объект (с индексом по статусу)
+        > limit - наибольшее количество задач (None - все задачи)
+
+        Задачи берутся из упорядоченного списка задач на исполнении,
+        который обновляется при каждом изменении списка задач,
+        поэтому ни поиск, ни сортировка не требуются.
+
+        Возвращает копию объекта класса Tasks с задачами со статусами
+        'Получена' и 'В процессе', упорядоченными по исполнителю и дате
+        выполнения по возрастанию.
+        '''
+        tasklist = Tasks(self.indexed)
+        tasklist.sources = self.sources
+
+        self.arrange()
+        for _, _, index in self.running[:limit]:
+            tasklist.insert(self.list[self.position(index)])
+
+        return tasklist
+
+    def failures(self, executor: str, limit: int = None):
+        '''Получение проваленных задач исполнителя.
+
+        > self - ссылка на объект (с индексом по статусу)
+        > executor - имя исполнителя
+        > limit - наибольшее количество задач (None - все задачи)
+
+        Задачи берутся из упорядоченного списка проваленных задач
+        исполнителя, поэтому время работы пропорционально количеству
+        этих задач.
+
+        Возвращает копию объекта класса Tasks с проваленными задачами
+        исполнителя, упорядоченными по дате выполнения по убыванию
+        и по задаче по возрастанию.
+        '''
+        tasklist = Tasks(self.indexed)
+        tasklist.sources = self.sources
+
+        self.arrange()
+        for _, _, index in self.failed.get(executor, [])[:limit]:
+            tasklist.insert(self.list[self.position(index)])
 
         return tasklist
 
@@ -292,9 +845,21 @@ class Tasks:
         > item - индекс атрибута задачи
         > value - значение атрибута задачи, по которому происходит поиск
 
+        Поиск по атрибуту 'ID' (item = 0) и по индексируемым атрибутам
+        выполняется через индексы.
+
         Возвращает список значений атрибутов найденной задачи, если
         же задача не была найдена вызывает исключение TaskNotFoundError.
         '''
+        if item == 0:
+            return self.list[self.position(value)]
+
+        if item in self.indexes:
+            bucket = self.indexes[item].get(value)
+            if not bucket:
+                raise TaskNotFoundError((item, value))
+            return self.list[min(self.position(index) for index in bucket)]
+
         found = False
 
         for task in self.list:
@@ -305,38 +870,170 @@ class Tasks:
         if not found:
             raise TaskNotFoundError((item, value))
 
-    def read(path: str):
+    def read(path: str, workers: int = None):
         '''Чтение из файла в объект класса Tasks.
 
         > path - путь, по которому находится файл
-
-        Создается новый объект класса Tasks, читается файл,
-        формируя значения всех атрибутов каждой задачи в необходимом
-        виде, после добавляя задачи в новый объект, если значения
-        даны в корректном виде.
+        > workers - количество процессов для параллельного чтения
+        (None - по умолчанию, то есть WORKERS, 0 - без процессов)
+
+        Создается новый объект класса Tasks с индексами по атрибутам
+        из INDEXED. Если рядом с файлом есть соответствующий ему снимок
+        (см. snapshot.load()), задачи берутся из снимка без разбора
+        и проверки строк. Иначе файл читается блоками (см. stream())
+        или по частям в нескольких процессах (см. load()), задачи
+        с корректными значениями атрибутов добавляются в новый объект,
+        а отчет об ошибках выводится после чтения. Затем к объекту
+        применяются изменения из журнала файла (см. replay()).
 
         Возвращает новый объект класса Tasks с данными из
         прочитанного файла.
         '''
-        obj = Tasks()
+        obj = Tasks(INDEXED)
+
+        if workers is None:
+            workers = WORKERS
+
+        report = []
+
+        tasklist = snapshot.load(path) if SNAPSHOTS else None
+        if tasklist is None and workers > 0:
+            tasklist = load(path, workers, report)
+        elif tasklist is None:
+            tasklist = stream(path, report=report)
+
+        for items in tasklist:
+            obj.insert(items)
 
-        file = open(path, "r", encoding="utf-8")
+        validator.print_report(report)
+
+        records = journal.load(path)
+        if records:
+            obj.replay(records)
+
+        return obj
+
+    def replay(self, records: list) -> None:
+        '''Применение записей журнала изменений к объекту.
+
+        > self - ссылка на объект
+        > records - строки записей журнала (см. save())
+
+        Записи разбираются функцией record(): поврежденные записи
+        и записи с некорректными значениями пропускаются, как и записи
+        о несуществующих задачах.
+
+        Используются только методы position(), insert(), replace() и
+        remove(), поэтому метод подходит и для других классов списка
+        задач (см. columns.ColumnTasks).
+
+        Ничего не возвращает.
+        '''
+        for string in records:
+            parsed = record(string)
+            if parsed is None:
+                continue
+
+            operation, index, items = parsed
+            if operation == "remove":
+                self.remove(index)
+                continue
 
-        strings = file.readlines()
-        index = 0
-        for string in strings:
-            index += 1
-            items = string.split("|")
-            items.insert(0, index)
             try:
-                items[7] = items[7].strip()
-                try:
-                    obj.add(items)
-                except log.ItemsError:
-                    print(f"Задача ID:{index} -> Слишком много данных!")
-            except IndexError:
-                print(f"Задача ID:{index} -> Не хватает данных!")
-        file.close()
+                position = self.position(index)
+            except TaskNotFoundError:
+                position = None
+
+            if operation == "add" and position is None:
+                self.insert(items)
+            elif operation == "edit" and position is not None:
+                self.replace(position, items)
+
+    def save(self, path: str) -> bool:
+        '''Сохранение изменений объекта в файл, из которого он прочитан.
+
+        > self - ссылка на объект
+        > path - путь к файлу, из которого прочитан объект
+
+        Если изменения объекта отслеживаются (self.journal), то в журнал
+        файла (см. модуль journal) дописываются только записи о них:
+        "add|ID|задача", "edit|ID|задача" или "remove|ID", где задача
+        записана так же, как в файле. Если же изменения не отслеживаются,
+        в журнале оказалось больше JOURNAL_LIMIT записей или записать
+        журнал нельзя (например, файла больше нет), файл записывается
+        целиком (см. write()), а журнал удаляется.
+
+        Возвращает булево значение (True/False), означающее был ли файл
+        записан целиком (тогда при чтении значениями 'ID' задач станут
+        номера строк, см. renumbered()).
+        '''
+        if self.journal is None:
+            self.write(path)
+            return True
+
+        if not self.journal:
+            return False
+
+        records = []
+        for operation, task in self.journal:
+            if operation == "remove":
+                records.append(f"remove|{task}")
+            else:
+                records.append(f"{operation}|{task[0]}|{line(task)}")
+
+        self.journal = []
+
+        # Новый ли журнал, определяется по его заголовку, а не по
+        # состоянию объекта: между сохранениями файл мог быть записан
+        # целиком или заменен. Если же файла нет (он удален или перемещен),
+        # журналу не к чему относиться, и файл записывается заново.
+        try:
+            count = journal.append(path, records)
+        except OSError:
+            count = None
+
+        if count is None or count > JOURNAL_LIMIT:
+            self.write(path)
+            return True
+
+        return False
+
+    def merge(paths: list, workers: int = None):
+        '''Чтение нескольких файлов в один объект класса Tasks.
+
+        > paths - пути, по которым находятся файлы
+        > workers - количество процессов (None - по умолчанию, то есть
+        по одному на файл, но не больше количества процессоров)
+
+        Файлы читаются одновременно в пуле процессов (см. collect()),
+        задачи добавляются в объект в порядке paths. К номеру строки
+        каждой задачи прибавляется наибольшее значение 'ID' (количество
+        строк) в предыдущих файлах,
+        так что значения 'ID' остаются уникальными, а файл задачи
+        находится по 'ID' (см. source()). Ошибки выводятся отдельно
+        для каждого файла, с номерами строк в нем.
+
+        Возвращает новый объект класса Tasks с задачами из всех файлов.
+        '''
+        obj = Tasks(INDEXED)
+
+        if workers is None:
+            workers = min(len(paths), os.cpu_count() or 1)
+
+        with concurrent.futures.ProcessPoolExecutor(max(workers, 1)) as pool:
+            parts = pool.map(collect, paths)
+
+            base = 0
+            for path, (count, good, report) in zip(paths, parts):
+                obj.sources.append((base, path))
+                if report:
+                    print(f"{path}:")
+                    validator.print_report(report)
+
+                for items in good:
+                    items[0] += base
+                    obj.insert(items)
+                base += count
 
         return obj
 
@@ -346,22 +1043,322 @@ class Tasks:
         > self - ссылка на объект
         > path - путь, по которому необходимо записать файл
 
-        Формирует данные обратно в необходимые для считывания из файла.
-        Записывает сформированные данные в файл по заданному пути.
+        Формирует данные обратно в необходимые для считывания из файла
+        и записывает их в файл по заданному пути (см. dump()), после
+        чего рядом записывается снимок базы данных (см. snapshot.save())
+        и удаляется журнал изменений файла (см. save()).
 
         Ничего не возвращает.
         '''
-        file = open(path, "w", encoding="utf-8")
+        dump(path, self.list)
 
-        for task in self.list:
-            string = ''
-            for item in range(len(task)):
-                if item == 1 or item == 3:
-                    string += f"{log.date_format(task[item])}|"
-                elif item == 7:
-                    string += f"{log.status_format(task[item])}\n"
-                elif item != 0:
-                    string += f"{task[item]}|"
-
-            file.write(string)
-        file.close()
+        if SNAPSHOTS:
+            snapshot.save(path, self.list)
+
+        # Журнал относился к прежнему содержимому файла.
+        journal.remove(path)
+
+
+def render(max_space: list, tasklist, source=None) -> str:
+    '''Формирование таблицы задач для вывода на экран.
+
+    > max_space - список с максимальной длиной значений всех атрибутов
+    > tasklist - последовательность списков атрибутов задач
+    > source - функция получения файла задачи по 'ID' (None - по умолчанию,
+    то есть без столбца с файлом, см. Tasks.source())
+
+    Строки таблицы собираются в список и объединяются один раз.
+
+    Возвращает текст таблицы с заголовком (с пустой строкой перед ним
+    и переводом строки после каждой строки таблицы).
+    '''
+    date = log.date_format
+    time = log.time_format
+    names = log.status_names
+
+    header = HEADER if source is None else HEADER + [SOURCE_HEADER]
+
+    strings = ["", log.string(max_space, header)]
+    for task in tasklist:
+        # Для каждой задачи значения атрибутов форматируются
+        labels = [
+            str(task[0]),
+            f"{date(task[1])} {time(task[2])}",
+            f"{date(task[3])} {time(task[4])}",
+            task[5], task[6], names[task[7]]
+            ]
+        if source is not None:
+            labels.append(source(task[0]))
+        strings.append(log.string(max_space, labels))
+    strings.append("")
+
+    return "\n".join(strings)
+
+
+def line(task: list) -> str:
+    '''Формирование строки файла для задачи.
+
+    > task - список атрибутов задачи (уже проверенных)
+
+    Значения атрибутов задач уже проверены, поэтому даты, время и статусы
+    преобразуются без повторной проверки (см. logic.date_format()).
+
+    Возвращает строку без 'ID' и без перевода строки.
+    '''
+    date = log.date_format
+    time = log.time_format
+
+    return (f"{date(task[1])}|{time(task[2])}|"
+            f"{date(task[3])}|{time(task[4])}|"
+            f"{task[5]}|{task[6]}|{log.status_names[task[7]]}")
+
+
+def dump(path: str, tasklist) -> None:
+    '''Запись задач в файл.
+
+    > path - путь, по которому необходимо записать файл
+    > tasklist - последовательность списков атрибутов задач
+
+    Строки (см. line()) записываются блоками по WRITE_CHUNK во временный файл,
+    который после записи заменяет файл по заданному пути, так что
+    при сбое во время записи прежний файл остается целым.
+
+    Ничего не возвращает.
+    '''
+    temp_path = path + ".tmp"
+
+    with open(temp_path, "w", encoding="utf-8") as file:
+        strings = []
+        for task in tasklist:
+            strings.append(line(task) + "\n")
+
+            if len(strings) == WRITE_CHUNK:
+                file.write("".join(strings))
+                strings.clear()
+
+        file.write("".join(strings))
+        file.flush()
+        os.fsync(file.fileno())
+
+    os.replace(temp_path, path)
+
+
+def split(strings, first: int) -> list:
+    '''Разбиение строк файла на значения атрибутов задач.
+
+    > strings - строки файла
+    > first - номер первой из строк в файле
+
+    Возвращает список списков атрибутов задач ('ID' - номер строки
+    в файле и строковые значения остальных атрибутов).
+    '''
+    rows = []
+
+    for index, string in enumerate(strings, first):
+        items = string.split("|")
+        items.insert(0, index)
+        if len(items) > 7:
+            items[7] = items[7].strip()
+        rows.append(items)
+
+    return rows
+
+
+def stream(path: str, item: int = None, value: str | int = None,
+           report: list = None):
+    '''Потоковое чтение задач из файла.
+
+    > path - путь, по которому находится файл
+    > item - индекс атрибута задачи, по которому задается условие
+    (None - по умолчанию, то есть возвращаются все задачи)
+    > value - значение атрибута, по которому задается условие
+    > report - список, в который добавляются ошибки (None - по умолчанию,
+    то есть сообщения об ошибках выводятся на экран)
+
+    Файл читается блоками по READ_CHUNK строк, без загрузки его целиком
+    в память, каждый блок проверяется целиком (см. validator.validate()).
+    Значением атрибута 'ID' задачи является номер строки в файле, поэтому
+    ошибки в отчете указываются сразу с этим номером. Читается только
+    сам файл: изменения из его журнала применяет вызывающий
+    (см. Tasks.replay()).
+    Если задано условие, то возвращаются только подходящие по нему
+    задачи (см. logic.condition()), значение сравнивается с уже
+    отформатированным значением атрибута.
+
+    Является генератором, возвращающим проверенные и отформатированные
+    списки атрибутов задач.
+    '''
+    index = 1
+
+    with open(path, "r", encoding="utf-8") as file:
+        while True:
+            rows = split(itertools.islice(file, READ_CHUNK), index)
+            if not rows:
+                break
+            index += len(rows)
+
+            good, errors = validator.validate(rows)
+            if report is None:
+                validator.print_report(errors)
+            else:
+                report.extend(errors)
+
+            for items in good:
+                if item is None or log.condition(item, items[item], value):
+                    yield items
+
+
+def bounds(path: str, parts: int) -> list:
+    '''Разбиение файла на части, выровненные по границам строк.
+
+    > path - путь, по которому находится файл
+    > parts - желательное количество частей
+
+    Части не меньше PARALLEL_CHUNK байт, каждая граница находится
+    сразу после символа перевода строки.
+
+    Возвращает список смещений границ частей в файле (от 0 до размера).
+    '''
+    size = os.path.getsize(path)
+    step = max(size // max(parts, 1), PARALLEL_CHUNK)
+    offsets = [0]
+
+    with open(path, "rb") as file:
+        while offsets[-1] + step < size:
+            file.seek(offsets[-1] + step)
+            file.readline()
+            if file.tell() >= size:
+                break
+            offsets.append(file.tell())
+
+    offsets.append(size)
+
+    return offsets
+
+
+def parse(path: str, start: int, end: int) -> tuple:
+    '''Разбор и проверка части файла (выполняется в отдельном процессе).
+
+    > path - путь, по которому находится файл
+    > start, end - смещения начала и конца части (см. bounds())
+
+    Строки нумеруются с единицы внутри части, номера исправляются
+    при объединении частей (см. load()).
+
+    Возвращает кортеж (количество строк в части, отформатированные
+    атрибуты корректных задач, отчет об ошибках (см. validator)).
+    '''
+    with open(path, "rb") as file:
+        file.seek(start)
+        data = file.read(end - start).decode("utf-8")
+
+    # Переводы строк распознаются так же, как при чтении в текстовом режиме.
+    rows = split(io.StringIO(data, newline=None), 1)
+    good, report = validator.validate(rows)
+
+    return len(rows), good, report
+
+
+def load(path: str, workers: int, report: list):
+    '''Параллельное чтение задач из файла.
+
+    > path - путь, по которому находится файл
+    > workers - количество процессов
+    > report - список, в который добавляются ошибки
+
+    Файл разбивается на части (см. bounds()), которые разбираются
+    и проверяются в пуле процессов (см. parse()). Результаты частей
+    объединяются по порядку: к номерам строк каждой части прибавляется
+    количество строк в предыдущих частях, так что значения 'ID' задач
+    и ошибки в отчете совпадают с последовательным чтением (см. stream()).
+
+    Является генератором, возвращающим проверенные и отформатированные
+    списки атрибутов задач.
+    '''
+    offsets = bounds(path, workers * 4)
+
+    with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+        parts = executor.map(parse, itertools.repeat(path),
+                             offsets[:-1], offsets[1:])
+
+        base = 0
+        for count, good, errors in parts:
+            report.extend((index + base, kind, value)
+                          for index, kind, value in errors)
+            for items in good:
+                items[0] += base
+                yield items
+            base += count
+
+
+def record(string: str) -> tuple | None:
+    '''Разбор записи журнала изменений.
+
+    > string - строка записи (см. Tasks.save())
+
+    Добавленные и измененные задачи проверяются так же, как строки
+    файла (см. validator.validate()).
+
+    Возвращает кортеж (операция, 'ID' задачи, отформатированные атрибуты
+    задачи или None для удаления), или None, если запись повреждена
+    (неизвестная операция, неверное количество значений, 'ID' не число)
+    или значения атрибутов некорректны.
+    '''
+    operation, *items = string.split("|")
+
+    try:
+        index = int(items.pop(0))
+    except (IndexError, ValueError):
+        return None
+
+    if operation == "remove":
+        return (operation, index, None) if not items else None
+
+    if operation not in ("add", "edit") or len(items) != 7:
+        return None
+
+    good = validator.validate([[index] + items])[0]
+    if not good:
+        return None
+
+    return operation, index, good[0]
+
+
+def collect(path: str) -> tuple:
+    '''Чтение файла целиком (выполняется в отдельном процессе).
+
+    > path - путь, по которому находится файл
+
+    Задачи берутся из снимка, если он соответствует файлу
+    (см. snapshot.load()), иначе файл разбирается (см. parse()).
+    Затем применяются изменения из журнала файла (см. Tasks.replay()).
+
+    Возвращает кортеж (наибольшее значение 'ID' в файле, отформатированные
+    атрибуты корректных задач, отчет об ошибках (см. validator)).
+    '''
+    tasklist = snapshot.load(path) if SNAPSHOTS else None
+    if tasklist is not None:
+        count, good, report = len(tasklist), tasklist, []
+    else:
+        count, good, report = parse(path, 0, os.path.getsize(path))
+
+    records = journal.load(path)
+    if records:
+        obj = Tasks()
+        for items in good:
+            obj.insert(items)
+        obj.replay(records)
+        count, good = max(count, obj.top), obj.list
+
+    return count, good, report
+
+
+def stamp(path: str) -> tuple:
+    '''Получение отметки о состоянии базы данных.
+
+    > path - путь к текстовому файлу с базой данных
+
+    Возвращает кортеж из отметок текстового файла (см. snapshot.stamp())
+    и его журнала изменений (см. journal.stamp()).
+    '''
+    return snapshot.stamp(path), journal.stamp(path)
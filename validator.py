@@ -0,0 +1,194 @@
+import re
+
+import logic as log
+
+
+# Форматы даты ДД.ММ.ГГГГ и ГГГГ.ММ.ДД и времени ЧЧ:ММ. Значения, не
+# подходящие под них, проверяются обычным образом (см. logic.date_mask(),
+# logic.time_mask()), так что правила проверки остаются прежними.
+DATE = re.compile(r"(\d\d)\.(\d\d)\.(\d{4})|(\d{4})\.(\d\d)\.(\d\d)", re.ASCII)
+TIME = re.compile(r"(\d\d):(\d\d)", re.ASCII)
+
+# Количество дней в месяцах обычного и високосного года (месяцы с 1).
+MONTH_DAYS = ((0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31),
+              (0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31))
+
+# Форматирование статуса из файла или введенного пользователем в то
+# представление, в котором он хранится в объекте ('a', 'b', 'c', 'd').
+# Сами эти представления допустимы и не меняются, так что в объекте
+# никогда не оказывается полное название статуса (см. tasks.line()).
+STATUSES = {"Провалена": 'a', "Получена": 'b',
+            "В процессе": 'c', "Выполнена": 'd',
+            'a': 'a', 'b': 'b', 'c': 'c', 'd': 'd'}
+
+# Сообщения для каждого вида ошибки в отчете (см. validate()).
+MESSAGES = {"short": "Не хватает данных!",
+            "long": "Слишком много данных!",
+            "date": "Некорректная дата: {}",
+            "time": "Некорректное время: {}",
+            "order": "Невозможное соотношение дат",
+            "executor": "Пустое значение 'Исполнитель'",
+            "task": "Пустое значение 'Задача'",
+            "status": "Некорректный статус: {}"}
+
+
+def parse_date(date: str) -> int | None:
+    '''Проверка и форматирование даты.
+
+    > date - дата из файла или введенная пользователем
+
+    Дата в одном из форматов проверяется по таблице дней в месяцах,
+    так что некорректные даты отбрасываются без разбора. Остальные
+    даты преобразуются через logic.date_parse(), поэтому одинаковые
+    даты из файла разбираются только один раз (см. logic.DATE_CACHE).
+
+    Возвращает номер дня (см. logic.date_number()), или None,
+    если дата некорректна.
+    '''
+    match = DATE.fullmatch(date)
+    if match is not None:
+        if match.group(1) is not None:
+            day, month, year = map(int, match.group(1, 2, 3))
+        else:
+            year, month, day = map(int, match.group(4, 5, 6))
+
+        if not (1 <= month <= 12
+                and 1 <= day <= MONTH_DAYS[log.leap_year(year)][month]):
+            return None
+
+    try:
+        return log.date_parse(date)
+    except log.DateError:
+        return None
+
+
+def parse_time(time: str) -> int | None:
+    '''Проверка и форматирование времени.
+
+    > time - время из файла или введенное пользователем
+
+    Возвращает номер минуты в сутках, или None, если время некорректно.
+    '''
+    match = TIME.fullmatch(time)
+    if match is None:
+        try:
+            return log.time_format(time)
+        except log.TimeError:
+            return None
+
+    hours, minutes = map(int, match.group(1, 2))
+    if hours < 24 and minutes < 60:
+        return hours * 60 + minutes
+
+    return None
+
+
+def column(values, parse) -> list:
+    '''Проверка и форматирование столбца значений.
+
+    > values - значения одного атрибута всех задач
+    > parse - функция форматирования значения (None - если некорректно)
+
+    Каждое различное значение форматируется только один раз.
+
+    Возвращает список отформатированных значений.
+    '''
+    cache = {}
+    result = []
+
+    for value in values:
+        if value not in cache:
+            cache[value] = parse(value)
+        result.append(cache[value])
+
+    return result
+
+
+def validate(rows: list) -> tuple:
+    '''Проверка атрибутов множества задач.
+
+    > rows - списки атрибутов задач ('ID' и строковые значения
+    остальных атрибутов, как в файле)
+
+    Проверки те же, что и в tasks.Tasks.items_check() и в том же
+    порядке, но выполняются по столбцам: даты, время и статусы
+    форматируются один раз для каждого различного значения. Для каждой
+    некорректной задачи в отчет попадает первая найденная ошибка
+    в виде кортежа ('ID' задачи, вид ошибки, значение), виды ошибок
+    перечислены в MESSAGES.
+
+    Возвращает кортеж (список отформатированных атрибутов корректных
+    задач, отчет об ошибках), задачи и ошибки идут в порядке rows.
+    '''
+    # Ошибки вместе с позициями задач в rows, чтобы сохранить их порядок.
+    errors = []
+    complete = []
+
+    for position, items in enumerate(rows):
+        if len(items) < 8:
+            errors.append((position, (items[0], "short", None)))
+        elif len(items) > 8:
+            errors.append((position, (items[0], "long", None)))
+        else:
+            complete.append((position, items))
+
+    columns = list(zip(*(items for _, items in complete))) or [()] * 8
+    parsed = zip(complete,
+                 column(columns[1], parse_date),
+                 column(columns[2], parse_time),
+                 column(columns[3], parse_date),
+                 column(columns[4], parse_time))
+
+    good = []
+    for (position, items), recv_date, recv_time, due_date, due_time in parsed:
+        status = STATUSES.get(items[7])
+
+        if recv_date is None:
+            error = ("date", items[1])
+        elif due_date is None:
+            error = ("date", items[3])
+        elif recv_time is None:
+            error = ("time", items[2])
+        elif due_time is None:
+            error = ("time", items[4])
+        elif (due_date < recv_date
+              or due_date == recv_date and due_time < recv_time):
+            error = ("order", None)
+        elif not items[5].strip(" "):
+            error = ("executor", None)
+        elif not items[6].strip(" "):
+            error = ("task", None)
+        elif status is None:
+            error = ("status", items[7])
+        else:
+            good.append([items[0], recv_date, recv_time, due_date, due_time,
+                         items[5], items[6], status])
+            continue
+
+        errors.append((position, (items[0],) + error))
+
+    errors.sort(key=lambda error: error[0])
+
+    return good, [error for _, error in errors]
+
+
+def messages(report: list) -> list:
+    '''Формирование сообщений об ошибках.
+
+    > report - отчет об ошибках (см. validate())
+
+    Возвращает список строк вида "Задача ID:1 -> сообщение".
+    '''
+    return [f"Задача ID:{index} -> {MESSAGES[kind].format(value)}"
+            for index, kind, value in report]
+
+
+def print_report(report: list) -> None:
+    '''Вывод отчета об ошибках на экран.
+
+    > report - отчет об ошибках (см. validate())
+
+    Ничего не возвращает.
+    '''
+    if report:
+        print("\n".join(messages(report)))